@@ -1416,7 +1416,8 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
                      "enabled_cost_functions", "control_signal_costs",
                      "default_allocation", "same_seed_for_all_allocations",
                      "search_statefulness", "initial_seed", "combine",
-                     "smoothing_factor",
+                     "comp_execution_threads", "comp_execution_chunk_size",
+                     "smoothing_factor", "approximate_retrieval", "retrieval_index",
                      }
         # Mechanism's need few extra entires:
         # * matrix -- is never used directly, and is flatened below
@@ -2344,7 +2345,7 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
                     skip_log=True,
                 )
 
-    def _initialize_from_context(self, context, base_context=Context(execution_id=None), override=True, visited=None):
+    def _initialize_from_context(self, context, base_context=Context(execution_id=None), override=True, visited=None, copy_on_access=False):
         if context.execution_id is base_context.execution_id:
             return
 
@@ -2354,12 +2355,12 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
         for comp in self._dependent_components:
             if comp not in visited:
                 visited.add(comp)
-                comp._initialize_from_context(context, base_context, override, visited=visited)
+                comp._initialize_from_context(context, base_context, override, visited=visited, copy_on_access=copy_on_access)
 
         non_alias_params = [p for p in self.stateful_parameters if not isinstance(p, (ParameterAlias, SharedParameter))]
         for param in non_alias_params:
             if param.setter is None:
-                param._initialize_from_context(context, base_context, override)
+                param._initialize_from_context(context, base_context, override, copy_on_access=copy_on_access)
 
         # attempt to initialize any params with setters (some params with setters may depend on the
         # initialization of other params)
@@ -2368,7 +2369,7 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
         # initialization value
         for param in non_alias_params:
             if param.setter is not None:
-                param._initialize_from_context(context, base_context, override)
+                param._initialize_from_context(context, base_context, override, copy_on_access=copy_on_access)
 
     def _delete_contexts(self, *contexts, check_simulation_storage=False, visited=None):
         if visited is None:
@@ -2384,6 +2385,27 @@ class Component(MDFSerializable, metaclass=ComponentsMeta):
                 for context in contexts:
                     param.delete(context)
 
+    def _get_context_memory_usage(self, context, visited=None):
+        """
+            Returns the approximate number of bytes used by the values of
+            the stateful Parameters of this Component and its dependent
+            Components in **context** (see `Parameter.get_memory_usage`)
+        """
+        if visited is None:
+            visited = set()
+
+        size = 0
+        for comp in self._dependent_components:
+            if comp not in visited:
+                visited.add(comp)
+                size += comp._get_context_memory_usage(context, visited=visited)
+
+        for param in self.stateful_parameters:
+            if not isinstance(param, (ParameterAlias, SharedParameter)):
+                size += param.get_memory_usage(context)
+
+        return size
+
     def _set_all_parameter_properties_recursively(self, visited=None, **kwargs):
         if visited is None:
             visited = set()
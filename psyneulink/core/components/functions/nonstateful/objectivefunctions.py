@@ -844,6 +844,65 @@ class Distance(ObjectiveFunction):
         denom = np.sqrt(np.sum(v1_norm ** 2) * np.sum(v2_norm ** 2)) or EPSILON
         return np.sum(v1_norm * v2_norm) / denom
 
+    def _distances(self, v1, v2):
+        """Return the distances between corresponding vectors in **v1** and **v2**.
+
+        Vectors lie along the last axis of **v1** and **v2**, which are broadcast against each other, so that the
+        distances between one vector and many others (e.g., the entries of a memory) are computed in a single call.
+        Uses the same `metric <Distance.metric>` and `normalize <Distance.normalize>` as `function <Distance.function>`,
+        but does not update the Function's `value <Distance.value>`.
+
+        Returns
+        -------
+
+        distances : array with the broadcast shape of **v1** and **v2** excluding their last axis
+
+        """
+        v1, v2 = np.broadcast_arrays(np.asarray(v1, dtype=float), np.asarray(v2, dtype=float))
+
+        if self.metric == MAX_ABS_DIFF:
+            result = np.max(np.fabs(v1 - v2), axis=-1)
+
+        elif self.metric == DIFFERENCE:
+            result = np.sum(np.fabs(v1 - v2), axis=-1)
+
+        elif self.metric == NORMED_L0_SIMILARITY:
+            result = 1.0 - np.sum(np.abs(v1 - v2), axis=-1) / 4.0
+
+        elif self.metric == EUCLIDEAN:
+            result = np.linalg.norm(v2 - v1, axis=-1)
+
+        elif self.metric in {COSINE, COSINE_SIMILARITY}:
+            numer = np.sum(v1 * v2, axis=-1)
+            denom = np.sqrt(np.sum(v1 ** 2, axis=-1)) * np.sqrt(np.sum(v2 ** 2, axis=-1))
+            return 1.0 - np.fabs(numer / np.where(denom == 0, EPSILON, denom))
+
+        elif self.metric == CORRELATION:
+            v1_norm = v1 - np.mean(v1, axis=-1, keepdims=True)
+            v2_norm = v2 - np.mean(v2, axis=-1, keepdims=True)
+            denom = np.sqrt(np.sum(v1_norm ** 2, axis=-1) * np.sum(v2_norm ** 2, axis=-1))
+            return 1.0 - np.fabs(np.sum(v1_norm * v2_norm, axis=-1) / np.where(denom == 0, EPSILON, denom))
+
+        elif self.metric == CROSS_ENTROPY:
+            if not self.is_initializing:
+                v1 = np.where(v1 == 0, EPSILON, v1)
+                v2 = np.where(v2 == 0, EPSILON, v2)
+            result = -np.sum(np.where(np.logical_and(v1 == 0, v2 == 0), 0.0, v1 * np.log(v2)), axis=-1)
+
+        elif self.metric == ENERGY:
+            result = -np.sum(v1 * v2, axis=-1) / 2.0
+
+        else:
+            assert False, '{} not a recognized metric in {}'.format(self.metric, self.__class__.__name__)
+
+        if self.normalize and self.metric not in {MAX_ABS_DIFF, CORRELATION}:
+            if self.metric == ENERGY:
+                result /= v1.shape[-1] ** 2.0
+            else:
+                result /= v1.shape[-1]
+
+        return result
+
     def __gen_llvm_sum_difference(self, builder, index, ctx, v1, v2, acc):
         ptr1 = builder.gep(v1, [index])
         ptr2 = builder.gep(v2, [index])
@@ -784,7 +784,9 @@ class OptimizationFunction(Function_Base):
         if execution_mode == "PTX":
             outcomes = comp_exec.cuda_evaluate(inputs, num_inputs_sets, num_evals)
         elif execution_mode == "LLVM":
-            outcomes = comp_exec.thread_evaluate(inputs, num_inputs_sets, num_evals)
+            outcomes = comp_exec.thread_evaluate(inputs, num_inputs_sets, num_evals,
+                                                 jobs=ocm.parameters.comp_execution_threads._get(context),
+                                                 chunk_size=ocm.parameters.comp_execution_chunk_size._get(context))
         else:
             assert False, f"Unknown execution mode for {ocm.name}: {execution_mode}."
 
@@ -25,6 +25,7 @@ Functions that store and can return a record of their input.
 
 import numbers
 import warnings
+import weakref
 from collections import deque
 from itertools import combinations, product
 # from typing import Optional, Union, Literal, Callable
@@ -44,7 +45,7 @@ from psyneulink.core.globals.context import handle_external_context
 from psyneulink.core.globals.keywords import \
     ADDITIVE_PARAM, BUFFER_FUNCTION, MEMORY_FUNCTION, COSINE, \
     ContentAddressableMemory_FUNCTION, DictionaryMemory_FUNCTION, \
-    MIN_INDICATOR, MULTIPLICATIVE_PARAM, NEWEST, NOISE, OLDEST, OVERWRITE, RATE, RANDOM, VARIABLE
+    EUCLIDEAN, MIN_INDICATOR, MULTIPLICATIVE_PARAM, NEWEST, NOISE, OLDEST, OVERWRITE, RATE, RANDOM, VARIABLE
 from psyneulink.core.globals.parameters import Parameter, check_user_specified
 from psyneulink.core.globals.preferences.basepreferenceset import is_pref_set
 from psyneulink.core.globals.utilities import \
@@ -53,6 +54,213 @@ from psyneulink.core.globals.utilities import \
 __all__ = ['MemoryFunction', 'Buffer', 'DictionaryMemory', 'ContentAddressableMemory', 'RETRIEVAL_PROB', 'STORAGE_PROB']
 
 
+# Number of entries written so far into each storage buffer allocated by _append_entries (keyed by id of buffer)
+_entry_buffer_ends = {}
+
+
+def _append_entries(entries:np.ndarray, new_entries:np.ndarray, max_entries:Optional[int]) -> np.ndarray:
+    """Return **entries** with **new_entries** appended along axis 0 (as np.append would)
+
+    Entries are kept in a preallocated buffer with capacity for 2 * **max_entries** and the array returned is a
+    view onto a contiguous slice of it, in order of storage (oldest first); evicting the oldest entries is therefore
+    simply slicing the array returned (O(1)).  **new_entries** are written into the buffer just after the end of
+    **entries** so long as there is room left in it and it has not been written beyond that point, so that any
+    views of earlier states of memory (e.g., in the history of previous_value) are never modified.  Otherwise, the
+    entries are copied into a new buffer, which happens at most once every **max_entries** stores once memory is
+    full.
+    """
+    num_entries = len(entries)
+    num_new = len(new_entries)
+    buffer = entries.base
+    dtype = np.result_type(entries, new_entries)
+
+    if (id(buffer) in _entry_buffer_ends
+            and buffer.dtype == dtype
+            and entries.shape[1:] == buffer.shape[1:] == new_entries.shape[1:]
+            and entries.strides == buffer.strides):
+        start, remainder = divmod(entries.__array_interface__['data'][0] - buffer.__array_interface__['data'][0],
+                                  buffer.strides[0])
+        end = start + num_entries
+        if not remainder and end == _entry_buffer_ends[id(buffer)] and end + num_new <= len(buffer):
+            buffer[end:end + num_new] = new_entries
+            _entry_buffer_ends[id(buffer)] = end + num_new
+            return buffer[start:end + num_new]
+
+    num_stored = num_entries + num_new
+    capacity = max(2 * num_stored, 8)
+    if max_entries is not None:
+        capacity = max(min(capacity, 2 * max_entries), num_stored)
+    buffer = np.empty((capacity, *new_entries.shape[1:]), dtype=dtype)
+    buffer[:num_entries] = entries
+    buffer[num_entries:num_stored] = new_entries
+    _entry_buffer_ends[id(buffer)] = num_stored
+    weakref.finalize(buffer, _entry_buffer_ends.pop, id(buffer), None)
+    return buffer[:num_stored]
+
+
+def _as_entry_rows(items, new_item) -> tuple:
+    """Return **items** as an array with one row per item, and **new_item** as an array with a single such row
+
+    Items are returned as a 2d array if they are all 1d and the same length as **new_item**; otherwise, they are
+    returned as a 1d array with dtype=object, each element of which is an item.
+    """
+    new_item = np.asarray(new_item)
+    if isinstance(items, np.ndarray) and (items.ndim == 2 and items.shape[1] == len(new_item) and new_item.ndim == 1
+                                          or items.ndim == 1 and items.dtype == object and len(items)):
+        rows = items
+    else:
+        items = [np.asarray(item) for item in items]
+        if new_item.ndim == 1 and all(item.shape == new_item.shape for item in items):
+            rows = np.array(items).reshape(len(items), len(new_item))
+        else:
+            rows = np.empty(len(items), dtype=object)
+            for i, item in enumerate(items):
+                rows[i] = item
+
+    if rows.dtype == object and rows.ndim == 1:
+        new_row = np.empty(1, dtype=object)
+        new_row[0] = new_item
+    else:
+        new_row = new_item[np.newaxis]
+    return rows, new_row
+
+
+# Number of hash tables used by _LSHIndex if approximate_retrieval is True
+LSH_DEFAULT_NUM_TABLES = 8
+# Approximate number of entries per bucket of each hash table of an _LSHIndex
+LSH_BUCKET_SIZE = 16
+
+
+class _LSHIndex:
+    """Random projection locality-sensitive hashing (LSH) index of the entries in memory of a MemoryFunction
+
+    Each entry (flattened to 1d) is projected onto num_tables * num_bits random directions and, for each hash table,
+    assigned to the bucket identified by num_bits of those projections:  their signs for COSINE distance (random
+    hyperplanes), and their quantized values for EUCLIDEAN distance (p-stable projections).  Entries near each other
+    in the distance metric are likely to share a bucket in at least one table, so the entries in the buckets of a
+    cue are candidates for retrieval, among which the distance to the cue is computed exactly;  more tables
+    increases the chance that the nearest entry is among them, at the cost of more candidates.  num_bits is chosen
+    when the index is built so that buckets hold about LSH_BUCKET_SIZE entries, and the index is rebuilt if the
+    number of entries more than doubles.
+
+    The index is updated incrementally as entries are stored and deleted (see update);  it keeps track of the array
+    of entries in memory for which it is current, so if memory is assigned in any other way the index is rebuilt
+    the next time it is used.  Each entry is given a unique, increasing id, and positions of entries in memory are
+    found from the ids of the entries in memory (kept in the same order) by binary search.
+    """
+
+    def __init__(self, entries:np.ndarray, metric:str, num_tables:int):
+        vectors = entries.reshape(len(entries), -1)
+        self.metric = metric
+        self.num_tables = num_tables
+        self.num_bits = int(np.clip(np.log2(max(len(entries), 1) / LSH_BUCKET_SIZE), 1, 16))
+        self.max_entries = 2 * max(len(entries), LSH_BUCKET_SIZE)
+
+        random_state = np.random.RandomState(0)
+        self._projections = random_state.normal(size=(vectors.shape[1], num_tables * self.num_bits))
+        if metric == EUCLIDEAN:
+            projected = vectors @ self._projections
+            self._width = 2 * np.mean(np.std(projected, axis=0)) if len(entries) > 1 else 1.0
+            self._width = self._width or 1.0
+            self._offsets = random_state.uniform(0, self._width, size=num_tables * self.num_bits)
+
+        self._tables = [{} for _ in range(num_tables)]
+        self._buckets_of_ids = {}
+        self._ids = np.arange(len(entries))
+        self._next_id = len(entries)
+        for entry_id, buckets in zip(self._ids, self._get_buckets(vectors)):
+            self._add(entry_id, buckets)
+        self._set_entries(entries)
+
+    @staticmethod
+    def _get_layout(entries:np.ndarray) -> tuple:
+        # Array that owns the data of entries, and where in it they are (entries can be a new view of the same
+        #    data each time they are accessed, e.g., as keys of DictionaryMemory memory stored as a 3d array)
+        owner = entries.base if isinstance(entries.base, np.ndarray) else entries
+        return owner, (entries.__array_interface__['data'][0], entries.shape, entries.strides)
+
+    def _set_entries(self, entries:Optional[np.ndarray]):
+        if entries is None or entries.dtype == object:
+            self._entries = None
+        else:
+            owner, layout = self._get_layout(entries)
+            self._entries = (weakref.ref(owner), layout)
+
+    def _indexes(self, entries:np.ndarray) -> bool:
+        if self._entries is None or not isinstance(entries, np.ndarray):
+            return False
+        owner, layout = self._get_layout(entries)
+        return self._entries[0]() is owner and self._entries[1] == layout
+
+    def is_current(self, entries:np.ndarray, metric:str, num_tables:int) -> bool:
+        """Return True if the index is of **entries** and can be used as is"""
+        return (self._indexes(entries) and metric == self.metric and num_tables == self.num_tables
+                and len(entries) <= self.max_entries)
+
+    def _get_buckets(self, vectors:np.ndarray) -> list:
+        """Return, for each of **vectors**, the key of its bucket in each hash table"""
+        projected = vectors @ self._projections
+        if self.metric == EUCLIDEAN:
+            codes = np.floor((projected + self._offsets) / self._width).astype(np.int64)
+        else:
+            codes = (projected > 0).astype(np.int64)
+        codes = codes.reshape(len(vectors), self.num_tables, self.num_bits)
+        return [[table_codes.tobytes() for table_codes in vector_codes] for vector_codes in codes]
+
+    def _add(self, entry_id:int, buckets:list):
+        for table, bucket in zip(self._tables, buckets):
+            table.setdefault(bucket, set()).add(entry_id)
+        self._buckets_of_ids[entry_id] = buckets
+
+    def _remove(self, entry_id:int):
+        for table, bucket in zip(self._tables, self._buckets_of_ids.pop(entry_id)):
+            table[bucket].discard(entry_id)
+            if not table[bucket]:
+                del table[bucket]
+
+    def update(self, entries:np.ndarray, previous_entries:np.ndarray, replaced:Optional[int]=None,
+               num_appended:int=0, num_evicted:int=0, removed:Optional[list]=None):
+        """Update the index of **previous_entries** to be the index of **entries**
+
+        Applies, in order:  replacement of the entry at position **replaced**, appending of the last
+        **num_appended** of **entries**, eviction of the oldest **num_evicted** entries, and removal of the entries
+        at each position in **removed** (in turn, each relative to the entries remaining after the previous one).
+        If the index is not of **previous_entries**, it is left to be rebuilt when it is next used.
+        """
+        if not self._indexes(previous_entries):
+            return
+        if entries is None or entries.dtype == object:
+            self._set_entries(None)
+            return
+
+        vectors = entries.reshape(len(entries), -1)
+        if replaced is not None:
+            entry_id = self._ids[replaced]
+            self._remove(entry_id)
+            self._add(entry_id, self._get_buckets(vectors[replaced:replaced + 1])[0])
+        if num_appended:
+            new_ids = np.arange(self._next_id, self._next_id + num_appended)
+            self._next_id += num_appended
+            for entry_id, buckets in zip(new_ids, self._get_buckets(vectors[len(vectors) - num_appended:])):
+                self._add(entry_id, buckets)
+            self._ids = _append_entries(self._ids, new_ids, None)
+        for entry_id in self._ids[:num_evicted]:
+            self._remove(entry_id)
+        self._ids = self._ids[num_evicted:]
+        for position in removed or []:
+            self._remove(self._ids[position])
+            self._ids = np.delete(self._ids, position)
+
+        self._set_entries(entries)
+
+    def get_candidates(self, cue:np.ndarray) -> np.ndarray:
+        """Return positions in memory of the entries that share a bucket with **cue** in any hash table"""
+        buckets = self._get_buckets(np.reshape(cue, (1, -1)))[0]
+        candidate_ids = set().union(*(table.get(bucket, ()) for table, bucket in zip(self._tables, buckets)))
+        candidate_ids = np.sort(np.fromiter(candidate_ids, dtype=self._ids.dtype, count=len(candidate_ids)))
+        return np.searchsorted(self._ids, candidate_ids)
+
+
 class MemoryFunction(StatefulFunction):  # -----------------------------------------------------------------------------
     componentType = MEMORY_FUNCTION
 
@@ -66,6 +274,40 @@ class MemoryFunction(StatefulFunction):  # -------------------------------------
         # other stateful functions
         super(StatefulFunction, self)._update_default_variable(new_default_variable, context=context)
 
+    def _get_retrieval_candidates(self, cue:np.ndarray, entries:np.ndarray, context) -> Optional[np.ndarray]:
+        """Return positions in **entries** of the candidates for retrieval of **cue** found using the approximate
+        nearest neighbor index of **entries** (building it if necessary), or None if all entries must be searched
+        (approximate_retrieval is not specified or does not apply, or no candidates were found).
+        """
+        approximate_retrieval = self.parameters.approximate_retrieval._get(context)
+        if not approximate_retrieval or not isinstance(entries, np.ndarray) or entries.dtype == object:
+            return None
+
+        distance_function = self.parameters.distance_function._get(context)
+        selection_function = self.parameters.selection_function._get(context)
+        if not (isinstance(distance_function, Distance)
+                and distance_function.metric in {COSINE, EUCLIDEAN}
+                and isinstance(selection_function, OneHot)
+                and selection_function.mode == MIN_INDICATOR
+                and len(entries)):
+            return None
+
+        metric = distance_function.metric
+        num_tables = LSH_DEFAULT_NUM_TABLES if approximate_retrieval is True else int(approximate_retrieval)
+        retrieval_index = self.parameters.retrieval_index._get(context)
+        if retrieval_index is None or not retrieval_index.is_current(entries, metric, num_tables):
+            retrieval_index = _LSHIndex(entries, metric, num_tables)
+            self.parameters.retrieval_index._set(retrieval_index, context)
+
+        candidates = retrieval_index.get_candidates(cue)
+        return candidates if len(candidates) else None
+
+    def _update_retrieval_index(self, entries:np.ndarray, previous_entries:np.ndarray, context, **changes):
+        """Update approximate nearest neighbor index (if there is one) for changes to entries (see _LSHIndex.update)"""
+        retrieval_index = self.parameters.retrieval_index._get(context)
+        if retrieval_index is not None:
+            retrieval_index.update(entries, previous_entries, **changes)
+
 
 class Buffer(MemoryFunction):  # ------------------------------------------------------------------------------
     """
@@ -380,6 +622,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         duplicate_threshold=0,                       \
         equidistant_entries_select=RANDOM,           \
         max_entries=None,                            \
+        approximate_retrieval=False,                 \
         params=None,                                 \
         owner=None,                                  \
         prefs=None,                                  \
@@ -454,10 +697,10 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
     `distance_function <ContentAddressableMemory.distance_function>` can be specified
     using `equidistant_entries_select <ContentAddressableMemory.equidistant_entries_select>`.
 
-    The class also provides methods for directly retrieving (`get_memory
-    <ContentAddressableMemory.get_memory>`), adding (`add_to_memory <ContentAddressableMemory.add_to_memory>`)
-    and deleting (`delete_from_memory <ContentAddressableMemory.delete_from_memory>`) one or more entries from
-    `memory <ContentAddressableMemory.memory>`.
+    The class also provides methods for directly retrieving (`get_memory <ContentAddressableMemory.get_memory>` and
+    `get_memories <ContentAddressableMemory.get_memories>`), adding (`add_to_memory
+    <ContentAddressableMemory.add_to_memory>`) and deleting (`delete_from_memory
+    <ContentAddressableMemory.delete_from_memory>`) one or more entries from `memory <ContentAddressableMemory.memory>`.
 
     .. _ContentAddressableMemory_Structure:
 
@@ -483,6 +726,43 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
        length (`ragged <https://en.wikipedia.org/wiki/Jagged_array>`_) then, although each field is 1d, an entry is
        also 1d (with dtype='object'), and `memory <ContentAddressableMemory.memory>` is 2d (with dtype='object').
 
+    .. _ContentAddressableMemory_Retrieval_Vectorized:
+
+    .. technical_note::
+       If `memory <ContentAddressableMemory.memory>` is a regular (3d) array, `distance_function
+       <ContentAddressableMemory.distance_function>` is a `Distance` Function, and `distance_field_weights
+       <ContentAddressableMemory.distance_field_weights>` are all numeric, then the distances of a cue to all
+       entries are computed together, in a single call that operates on the entire array, rather than by calling
+       `distance_function <ContentAddressableMemory.distance_function>` for each entry; `get_memories
+       <ContentAddressableMemory.get_memories>` can be used to do this for several cues at once.
+
+    .. _ContentAddressableMemory_Approximate_Retrieval:
+
+    .. technical_note::
+       For very large memories, `approximate_retrieval <ContentAddressableMemory.approximate_retrieval>` can be used
+       to avoid computing the distance of a cue to every entry.  Entries are then indexed using random projection
+       locality-sensitive hashing, which groups entries that are likely to be near each other into the same buckets,
+       and the distances of a cue are computed only to the entries in its buckets;  if there are none, the distances
+       to all entries are computed.  The index is used only if `distance_function
+       <ContentAddressableMemory.distance_function>` is a `Distance` Function with metric *COSINE* or *EUCLIDEAN*,
+       `selection_function <ContentAddressableMemory.selection_function>` is `OneHot` with mode *MIN_INDICATOR*,
+       `distance_field_weights <ContentAddressableMemory.distance_field_weights>` are all the same, and `memory
+       <ContentAddressableMemory.memory>` is a regular (3d) array.  It is updated as entries are added to and
+       deleted from memory, and rebuilt as needed (for example, if `memory <ContentAddressableMemory.memory>` is
+       reset or the number of entries in it more than doubles).  When it is used, `distances_to_entries
+       <ContentAddressableMemory.distances_to_entries>` contains the distances only to the entries that were
+       compared with the cue.
+
+    .. _ContentAddressableMemory_Storage_Buffer:
+
+    .. technical_note::
+       Entries are stored in a buffer preallocated with room for twice `max_entries
+       <ContentAddressableMemory.max_entries>`, and `memory <ContentAddressableMemory.memory>` is a view of the
+       entries currently in it, oldest first.  Storing an entry writes it into the buffer after the last one, and
+       deleting the oldest one when `max_entries <ContentAddressableMemory.max_entries>` is exceeded simply moves
+       the start of the view, so neither copies the other entries in `memory <ContentAddressableMemory.memory>`;
+       they are copied to a new buffer only when the end of the current one is reached.
+
     .. _ContentAddressableMemory_Execution:
 
     **Execution**
@@ -804,6 +1084,10 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         specifies the maximum number of entries allowed in `memory <ContentAddressableMemory.memory>`
         (see `max_entries <ContentAddressableMemory.max_entries>` for additional details).
 
+    approximate_retrieval : bool or int : default False
+        specifies whether to use an approximate nearest neighbor index to find the entries to compare with a cue
+        on retrieval (see `approximate_retrieval <ContentAddressableMemory.approximate_retrieval>` for details).
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -926,6 +1210,12 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         maximum number of entries allowed in `memory <ContentAddressableMemory.memory>`;  if storing a memory
         exceeds the number, the oldest memory is deleted.
 
+    approximate_retrieval : bool or int
+        if True or an int, entries are retrieved using an approximate nearest neighbor index of `memory
+        <ContentAddressableMemory.memory>` (see `ContentAddressableMemory_Approximate_Retrieval`);  an int specifies
+        the number of hash tables used (more increases the chance of retrieving the nearest entry, but makes
+        retrieval slower).
+
     previous_value : ndarray
         state of the `memory <ContentAddressableMemory.memory>` prior to storing `variable
         <ContentAddressableMemory.variable>` in the current call.
@@ -967,6 +1257,12 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
                     :default value: [[0], [0]]
                     :type: ``list``
 
+                approximate_retrieval
+                    see `approximate_retrieval <ContentAddressableMemory.approximate_retrieval>`
+
+                    :default value: False
+                    :type: ``bool or int``
+
                 distance
                     see `distance <ContentAddressableMemory.distance>`
 
@@ -1112,6 +1408,8 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         distance = Parameter(0, stateful=True, read_only=True)
         distances_by_field = Parameter([0], stateful=True, read_only=True)
         distances_to_entries = Parameter([0], stateful=True, read_only=True)
+        approximate_retrieval = Parameter(False, stateful=False)
+        retrieval_index = Parameter(None, stateful=True, loggable=False, pnl_internal=True, read_only=True)
 
         def _validate_retrieval_prob(self, retrieval_prob):
             retrieval_prob = float(retrieval_prob)
@@ -1187,6 +1485,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
                  duplicate_threshold=None,
                  equidistant_entries_select=None,
                  max_entries=None,
+                 approximate_retrieval=None,
                  seed=None,
                  params=None,
                  owner=None,
@@ -1207,6 +1506,7 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
             rate=rate,
             noise=noise,
             max_entries=max_entries,
+            approximate_retrieval=approximate_retrieval,
             seed=seed,
             params=params,
             owner=owner,
@@ -1508,11 +1808,97 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
         cue = convert_all_elements_to_np_array(cue)
         self._validate_entry(cue, context)
 
+        # Restrict search to candidates from approximate nearest neighbor index if it applies, which requires
+        #    distance of full entries (i.e., that field_weights are homogeneous, see _get_distance)
+        weights = np.atleast_1d(field_weights if field_weights is not None
+                                else self._get_current_parameter_value('distance_field_weights', context))
+        if weights.dtype != object and weights[0] and np.all(weights == weights[0]):
+            candidates = self._get_retrieval_candidates(cue, _memory, context)
+            if candidates is not None:
+                _memory = _memory[candidates]
+
         # Get mean of field-wise distances between cue each entry in memory
-        distances_to_entries = []
-        for entry in _memory:
-            distances_to_entries.append(self._get_distance(cue, entry, field_weights, 'full_entry', context))
+        distances_to_entries = list(self._get_distances_to_entries([cue], _memory, field_weights, context)[0])
+
+        return self._select_entry(cue, _memory, distances_to_entries, field_weights, context)
 
+    @handle_external_context()
+    def get_memories(self, cues:Union[list, np.ndarray], field_weights=None, context=None) -> list:
+        """get_memories(cues, field_weights=None, context=None)
+
+        Retrieve the entry from `memory <ContentAddressableMemory.memory>` that best matches each of **cues**, as
+        `get_memory <ContentAddressableMemory.get_memory>` does for a single cue.  The distances of all cues to all
+        entries in `memory <ContentAddressableMemory.memory>` are computed together (see
+        `ContentAddressableMemory_Retrieval_Vectorized`).
+
+        Arguments
+        ---------
+        cues : list or 3d array
+          list of cues, each of which must have same number and shapes of fields as existing entries in `memory
+          <ContentAddressableMemory.memory>`.
+
+        Returns
+        -------
+        entries retrieved : list of 2d arrays
+          one for each cue; if no retrieval occurs, each is an appropriately shaped zero-valued array.
+          `distance <ContentAddressableMemory.distance>`, `distances_by_field
+          <ContentAddressableMemory.distances_by_field>` and `distances_to_entries
+          <ContentAddressableMemory.distances_to_entries>` are assigned for the last cue.
+
+        """
+        _memory = self.parameters.previous_value._get(context)
+        # if no entries in memory, return the zero vector for every cue
+        if _memory is None:
+            return [self.uniform_entry(0, context) for cue in cues]
+
+        cues = [convert_all_elements_to_np_array(cue) for cue in cues]
+        for cue in cues:
+            self._validate_entry(cue, context)
+
+        distances = self._get_distances_to_entries(cues, _memory, field_weights, context)
+
+        return [self._select_entry(cue, _memory, list(distances_to_entries), field_weights, context)
+                for cue, distances_to_entries in zip(cues, distances)]
+
+    def _get_distances_to_entries(self, cues:list, memory:np.ndarray, field_weights, context):
+        """Get distances of each of **cues** to every entry in **memory**, with one row of distances per cue.
+
+        If **memory** is a regular (3d) array and `distance_function <ContentAddressableMemory.distance_function>` is
+        a `Distance` Function, the field-weighted distances of all cues to all entries are computed by a single
+        vectorized call to the distance function; otherwise, `_get_distance` is called for each cue and entry.
+        """
+        distance_fct = self.parameters.distance_function._get(context)
+        if field_weights is None:
+            # Could be from get_memory called from COMMAND LINE without field_weights
+            field_weights = self._get_current_parameter_value('distance_field_weights', context)
+        weights = np.atleast_1d(field_weights)
+
+        regular_cues = convert_all_elements_to_np_array(cues)
+        if (isinstance(distance_fct, Distance)
+                and memory.dtype != object and memory.ndim == 3
+                and regular_cues.dtype != object and regular_cues.shape[1:] == memory.shape[1:]
+                and weights.dtype != object):
+            num_cues, num_entries = len(regular_cues), len(memory)
+
+            # Homogeneous field_weights: distance of full entries, scaled by the weight (as in _get_distance)
+            if np.all(weights[0] == weights):
+                return distance_fct._distances(regular_cues.reshape(num_cues, 1, -1),
+                                               memory.reshape(1, num_entries, -1)) * weights[0]
+
+            if len(weights) == memory.shape[1]:
+                # Mean of distances of weighted fields (fields with 0 weights are ignored)
+                fields = np.flatnonzero(weights)
+                distances_by_field = distance_fct._distances(regular_cues[:, np.newaxis, fields],
+                                                             memory[np.newaxis, :, fields])
+                return np.sum(distances_by_field * weights[fields], axis=-1) / len(fields)
+
+        return [[self._get_distance(cue, entry, field_weights, 'full_entry', context) for entry in memory]
+                for cue in cues]
+
+    def _select_entry(self, cue:np.ndarray, _memory:np.ndarray, distances_to_entries:list, field_weights, context):
+        """Return the entry in **_memory** selected based on **distances_to_entries** and `selection_function
+        <ContentAddressableMemory.selection_function>`, and assign the distance parameters for it.
+        """
         # Get the best-match(es) in memory based on selection_function and return as non-zero value(s) in an array
         selection_array = self.selection_function(distances_to_entries, context=context)
         indices_of_selected_items = np.flatnonzero(selection_array)
@@ -1609,9 +1995,16 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
                 raise ContentAddressableMemory(f"Unrecognized format for entry to be stored in {self.name}: {entry}.")
             return np.atleast_3d(entry).reshape(shape)
 
+        previous_entries = existing_entries
+        index_changes = {}
         if existing_entries is not None:
             # Check for matches of entry with existing entries
-            matches = [m for m in existing_entries if len(m) and self._is_duplicate(entry, m, field_weights, context)]
+            #    (not needed if duplicates are allowed, as then the entry is added whether or not there are any)
+            if self.duplicate_entries_allowed is True:
+                matches = []
+            else:
+                matches = [m for m in existing_entries
+                           if len(m) and self._is_duplicate(entry, m, field_weights, context)]
 
             # If duplicate entries are not allowed and entry matches any existing entries, don't store
             if matches and self.duplicate_entries_allowed is False:
@@ -1633,10 +2026,12 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
                 except ValueError:
                     index = existing_entries.tolist().index(entry)
                 existing_entries[index] = entry
+                index_changes['replaced'] = index
                 storage_succeeded = True
             else:
                 # Add to existing entries
-                existing_entries = np.append(existing_entries, format_for_storage(entry), axis=0)
+                existing_entries = _append_entries(existing_entries, format_for_storage(entry), self.max_entries)
+                index_changes['num_appended'] = 1
                 storage_succeeded = True
 
         else:
@@ -1645,8 +2040,10 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
             storage_succeeded = True
 
         if len(existing_entries) > self.max_entries:
-            existing_entries = np.delete(existing_entries,0,axis=0)
+            existing_entries = existing_entries[1:]
+            index_changes['num_evicted'] = 1
 
+        self._update_retrieval_index(existing_entries, previous_entries, context, **index_changes)
         self.parameters.previous_value._set(existing_entries,context)
         self._memory = existing_entries
 
@@ -1789,11 +2186,14 @@ class ContentAddressableMemory(MemoryFunction): # ------------------------------
 
         existing_memory = self.parameters.previous_value._get(context)
         pruned_memory = existing_memory.copy()
+        removed = []
         for entry, memory in product(entries, existing_memory):
             if (np.all(entry == memory)
                     or fields and all(entry[f] == memory[f] for f in fields)):
-                pruned_memory = np.delete(pruned_memory, pruned_memory.tolist().index(memory.tolist()), axis=0)
+                removed.append(pruned_memory.tolist().index(memory.tolist()))
+                pruned_memory = np.delete(pruned_memory, removed[-1], axis=0)
         self._memory = convert_all_elements_to_np_array(pruned_memory)
+        self._update_retrieval_index(self._memory, existing_memory, context, removed=removed)
         self.parameters.previous_value._set(self._memory, context)
 
     def _parse_memories(self, entries, method, context=None):
@@ -1862,6 +2262,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         equidistant_keys_select=RANDOM,              \
         duplicate_keys=False,                        \
         max_entries=None,                            \
+        approximate_retrieval=False,                 \
         params=None,                                 \
         owner=None,                                  \
         prefs=None,                                  \
@@ -1980,6 +2381,10 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         specifies the maximum number of entries allowed in `memory <DictionaryMemory.memory>`
         (see `max_entries <DictionaryMemory.max_entries for additional details>`).
 
+    approximate_retrieval : bool or int : default False
+        specifies whether to use an approximate nearest neighbor index to find the keys to compare with a query
+        key on retrieval (see `approximate_retrieval <DictionaryMemory.approximate_retrieval>` for details).
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterPort_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -2060,6 +2465,13 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
         maximum number of entries allowed in `memory <DictionaryMemory.memory>`;  if storing a memory
         exceeds the number, the oldest memory is deleted.
 
+    approximate_retrieval : bool or int
+        if True or an int, keys are retrieved using an approximate nearest neighbor index of the keys in `memory
+        <DictionaryMemory.memory>`, as described for `ContentAddressableMemory
+        <ContentAddressableMemory_Approximate_Retrieval>`;  an int specifies the number of hash tables used (more
+        increases the chance of retrieving the nearest key, but makes retrieval slower).  This is used only for
+        execution in Python.
+
     random_state : numpy.RandomState
         private pseudorandom number generator
 
@@ -2096,6 +2508,12 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
                     :default value: [[0], [0]]
                     :type: ``list``
 
+                approximate_retrieval
+                    see `approximate_retrieval <DictionaryMemory.approximate_retrieval>`
+
+                    :default value: False
+                    :type: ``bool or int``
+
                 distance_function
                     see `distance_function <DictionaryMemory.distance_function>`
 
@@ -2185,6 +2603,8 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
 
         distance_function = Parameter(Distance(metric=COSINE), stateful=False, loggable=False)
         selection_function = Parameter(OneHot(mode=MIN_INDICATOR), stateful=False, loggable=False)
+        approximate_retrieval = Parameter(False, stateful=False)
+        retrieval_index = Parameter(None, stateful=True, loggable=False, pnl_internal=True, read_only=True)
 
 
     @check_user_specified
@@ -2201,6 +2621,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
                  duplicate_keys:tc.optional(tc.any(bool, tc.enum(OVERWRITE)))=None,
                  equidistant_keys_select:tc.optional(tc.enum(RANDOM, OLDEST, NEWEST))=None,
                  max_entries=None,
+                 approximate_retrieval:tc.optional(tc.any(bool, int))=None,
                  seed=None,
                  params: tc.optional(tc.optional(tc.any(list, np.ndarray))) = None,
                  owner=None,
@@ -2221,6 +2642,7 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
             rate=rate,
             noise=noise,
             max_entries=max_entries,
+            approximate_retrieval=approximate_retrieval,
             seed=seed,
             params=params,
             owner=owner,
@@ -2682,15 +3104,20 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
             return [zeros_key, zeros_val]
 
         # Get distances between query_key and all keys in memory
-        distances = [self.distance_function([query_key, list(m)]) for m in _memory[KEYS]]
+        #    (or only the candidates from the approximate nearest neighbor index if it applies)
+        candidates = self._get_retrieval_candidates(np.asarray(query_key), _memory[KEYS], context)
+        keys = _memory[KEYS] if candidates is None else _memory[KEYS][candidates]
+        distances = [self.distance_function([query_key, list(m)]) for m in keys]
 
         # Get the best-match(es) in memory based on selection_function and return as non-zero value(s) in an array
         selection_array = self.selection_function(distances, context=context)
         indices_of_selected_items = np.flatnonzero(selection_array)
+        if candidates is not None:
+            indices_of_selected_items = candidates[indices_of_selected_items]
 
         # Single key identified
         if len(indices_of_selected_items)==1:
-            index_of_selected_item = int(np.flatnonzero(selection_array))
+            index_of_selected_item = int(indices_of_selected_items[0])
         # More than one key identified
         else:
             selected_keys = _memory[KEYS]
@@ -2731,47 +3158,43 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
 
         self._validate_memory(memory, context)
 
-        key = list(memory[KEYS])
-        val = list(memory[VALS])
-
         d = self.parameters.previous_value._get(context)
 
-        matches = [k for k in d[KEYS] if key==list(k)]
+        # Keys and values are stored as arrays with one row per entry (see _append_entries)
+        keys, key = _as_entry_rows(d[KEYS], memory[KEYS])
+        vals, val = _as_entry_rows(d[VALS], memory[VALS])
+
+        matches = np.flatnonzero([np.array_equal(k, key[0]) for k in keys] if keys.dtype == object
+                                 else np.all(keys == key, axis=1))
+        index_changes = {}
 
         # If dupliciate keys are not allowed and key matches any existing keys, don't store
-        if matches and self.duplicate_keys is False:
+        if len(matches) and self.duplicate_keys is False:
             storage_succeeded = False
 
         # If dupliciate_keys is specified as OVERWRITE, replace value for matching key:
-        elif matches and self.duplicate_keys == OVERWRITE:
+        elif len(matches) and self.duplicate_keys == OVERWRITE:
             if len(matches)>1:
                 raise FunctionError(f"Attempt to store item ({memory}) in {self.name} "
                                     f"with 'duplicate_keys'='OVERWRITE' "
                                     f"when there is more than one matching key in its memory; "
                                     f"'duplicate_keys' may have previously been set to 'True'")
-            try:
-                index = d[KEYS].index(key)
-            except AttributeError:
-                index = d[KEYS].tolist().index(key)
-            except ValueError:
-                index = np.array(d[KEYS]).tolist().index(key)
-            d[VALS][index] = val
+            vals[matches[0]] = val[0]
             storage_succeeded = True
 
         else:
-            # Append new key and value to their respective lists
-            keys = list(d[KEYS])
-            keys.append(key)
-            values = list(d[VALS])
-            values.append(val)
-
-            # Return 3d array with keys and vals as lists
-            d = [keys, values]
+            # Append new key and value to their respective arrays
+            keys = _append_entries(keys, key, self.max_entries)
+            vals = _append_entries(vals, val, self.max_entries)
+            index_changes['num_appended'] = 1
             storage_succeeded = True
 
-        if len(d[KEYS]) > self.max_entries:
-            d = np.delete(d, [KEYS], axis=1)
+        if len(keys) > self.max_entries:
+            keys, vals = keys[1:], vals[1:]
+            index_changes['num_evicted'] = 1
 
+        self._update_retrieval_index(keys, d[KEYS], context, **index_changes)
+        d = [keys, vals]
         self.parameters.previous_value._set(d,context)
         self._memory = d
 
@@ -2824,7 +3247,8 @@ class DictionaryMemory(MemoryFunction):  # -------------------------------------
                     if key_only or vals[j] == list(self._memory[VALS][j]):
                         memory_keys = np.delete(self._memory[KEYS],j,axis=0)
                         memory_vals = np.delete(self._memory[VALS],j,axis=0)
-                        self._memory = np.array([list(memory_keys), list(memory_vals)])
+                        self._update_retrieval_index(memory_keys, self._memory[KEYS], context, removed=[j])
+                        self._memory = [memory_keys, memory_vals]
                         self.parameters.previous_value._set(self._memory, context)
 
     def _parse_memories(self, memories, method, context=None):
@@ -1603,6 +1603,22 @@ class OptimizationControlMechanism(ControlMechanism):
                     :default value: `PYTHON`
                     :type: ``str``
 
+                comp_execution_chunk_size
+                    number of evaluations assigned to a thread at a time when `comp_execution_mode
+                    <OptimizationControlMechanism.comp_execution_mode>` is "LLVM"; if None, the size is
+                    selected automatically based on the number of evaluations and threads.
+
+                    :default value: None
+                    :type: ``int``
+
+                comp_execution_threads
+                    number of threads used to evaluate control allocations when `comp_execution_mode
+                    <OptimizationControlMechanism.comp_execution_mode>` is "LLVM"; if None, the number of
+                    available CPUs is used.
+
+                    :default value: None
+                    :type: ``int``
+
                 control_allocation_search_space
                     see `control_allocation_search_space <OptimizationControlMechanism.control_allocation_search_space>`
 
@@ -1712,6 +1728,8 @@ class OptimizationControlMechanism(ControlMechanism):
         search_space = Parameter(None, read_only=True)
         search_termination_function = Parameter(None, stateful=False, loggable=False)
         comp_execution_mode = Parameter('Python', stateful=False, loggable=False, pnl_internal=True)
+        comp_execution_threads = Parameter(None, stateful=False, loggable=False, pnl_internal=True)
+        comp_execution_chunk_size = Parameter(None, stateful=False, loggable=False, pnl_internal=True)
         search_statefulness = Parameter(True, stateful=False, loggable=False)
 
         # FIX: Should any of these be stateful?
@@ -3101,10 +3119,13 @@ class OptimizationControlMechanism(ControlMechanism):
         except AttributeError:
             self.parameters.simulation_ids._set([sim_context.execution_id], base_context)
 
+        # The frozen context is not modified while simulations run,
+        # so its values only need to be copied when a simulation uses them
         self.agent_rep._initialize_as_agent_rep(
             sim_context,
             base_context=self._get_frozen_context(base_context),
-            alt_controller=alt_controller
+            alt_controller=alt_controller,
+            copy_on_access=True
         )
 
         return sim_context
@@ -2750,12 +2750,14 @@ Class Reference
 """
 
 import collections
+import concurrent.futures
 import enum
 import functools
 import inspect
 import itertools
 import logging
 import sys
+import threading
 import typing
 import warnings
 from copy import deepcopy, copy
@@ -2867,6 +2869,45 @@ class RunError(Exception):
         return repr(self.error_value)
 
 
+# Facts about a Node used by Composition.execute that only change with the structure of the Composition:
+#    is_input:  Node has NodeRole.INPUT
+#    is_learning:  Node has NodeRole.LEARNING
+#    learning_projections:  LearningProjections to the MATRIX ParameterPorts of the Node's afferent
+#                           PathwayProjections in the Composition (empty unless the Node is a Mechanism
+#                           other than a RecurrentTransferMechanism)
+#    senders:  Mechanisms from which the Node receives Projections (empty unless the Node is a Mechanism)
+_NodeExecutionPlan = collections.namedtuple('_NodeExecutionPlan',
+                                            'is_input, is_learning, learning_projections, senders')
+
+
+# Threads used to execute the Mechanisms of an execution set concurrently (see Composition.execution_set_threads);
+#    shared by all Compositions, and grown as needed
+_EXECUTION_SET_THREAD_PREFIX = 'pnl_execution_set'
+_execution_set_pool = None
+_execution_set_pool_size = 0
+
+
+def _get_execution_set_pool(threads):
+    global _execution_set_pool, _execution_set_pool_size
+    if _execution_set_pool is None or _execution_set_pool_size < threads:
+        if _execution_set_pool is not None:
+            _execution_set_pool.shutdown(wait=False)
+        _execution_set_pool = concurrent.futures.ThreadPoolExecutor(max_workers=threads,
+                                                                    thread_name_prefix=_EXECUTION_SET_THREAD_PREFIX)
+        _execution_set_pool_size = threads
+
+    return _execution_set_pool
+
+
+def _execute_concurrently(executions, threads):
+    # Calls each of executions in the execution set pool and waits for all of them to complete,
+    #    raising the exception of the first one (in the order of executions) that failed, if any
+    futures = [_get_execution_set_pool(threads).submit(e) for e in executions]
+    concurrent.futures.wait(futures)
+    for f in futures:
+        f.result()
+
+
 class EdgeType(enum.Enum):
     """
         Attributes:
@@ -3358,6 +3399,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         controller_time_scale=TRIAL        \
         controller_condition=Always(),     \
         retain_old_simulation_data=None,   \
+        execution_set_threads=None,        \
         show_graph_attributes=None,        \
         name=None,                         \
         prefs=Composition.classPreference  \
@@ -3442,6 +3484,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         <OptimizationControlMechanism_Execution>` of the Composition (see `retain_old_simulation_data
         <Composition.retain_old_simulation_data>` for additional details).
 
+    execution_set_threads : int : default None
+        specifies the number of threads used to execute the Mechanisms in an execution set concurrently (see
+        `execution_set_threads <Composition.execution_set_threads>` for additional details).
+
     show_graph_attributes : dict : None
         specifies features of how the Composition is displayed when its `show_graph <ShowGraph.show_graph>`
         method is called or **animate** is specified in a call to its `run <Composition.run>` method
@@ -3712,6 +3758,18 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         <OptimizationControlMechanism_Execution>` are saved;
         if False, simulation values are deleted unless otherwise specified by individual Parameters.
 
+    execution_set_threads : int or None
+        if greater than 1, the `Mechanisms <Mechanism>` in a `TIME_STEP <TimeScale.TIME_STEP>` (i.e., in a set of
+        Nodes returned by the `scheduler <Composition.scheduler>` for execution) are executed concurrently, using up
+        to that many threads, when the Composition is executed in `Python <ExecutionMode.Python>` or `LLVM
+        <ExecutionMode.LLVM>` mode.  This only improves performance if the Mechanisms' functions release the GIL,
+        as is the case for large matrix operations and for compiled Mechanisms in `LLVM <ExecutionMode.LLVM>` mode.
+        A set is executed one Mechanism at a time (as it is if execution_set_threads is None or 1) if it contains a
+        `nested Composition <Composition_Nested>` or the `controller <Composition.controller>`, if any of its Nodes
+        receives a Projection from another Node in the set, during learning, animation, or if output is being
+        reported.  Since the Mechanisms in a set use only the values of other Nodes from prior `TIME_STEPs
+        <TimeScale.TIME_STEP>`, concurrent execution produces the same results.
+
     recorded_reports : str
         contains output and/or progress reports from execution(s) of Composition if *RECORD* is specified in the
         **report_to_devices** argument of a `Composition execution method <Composition_Execution_Methods>`.
@@ -3761,6 +3819,12 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                     :default value: []
                     :type: ``list``
 
+                execution_set_threads
+                    see `execution_set_threads <Composition.execution_set_threads>`
+
+                    :default value: None
+                    :type:
+
                 retain_old_simulation_data
                     see `retain_old_simulation_data <Composition.retain_old_simulation_data>`
 
@@ -3777,6 +3841,13 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         simulation_results = Parameter([], loggable=False, pnl_internal=True)
         retain_old_simulation_data = Parameter(False, stateful=False, loggable=False, pnl_internal=True)
         input_specification = Parameter(None, stateful=False, loggable=False, pnl_internal=True)
+        execution_set_threads = Parameter(None, stateful=False, loggable=False, pnl_internal=True)
+
+        def _validate_execution_set_threads(self, execution_set_threads):
+            if execution_set_threads is not None and (
+                not isinstance(execution_set_threads, (int, np.integer)) or execution_set_threads < 1
+            ):
+                return 'must be None or a positive integer'
 
 
     class _CompilationData(ParametersBase):
@@ -3797,6 +3868,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             controller_time_scale=TimeScale.TRIAL,
             controller_condition:Condition=Always(),
             retain_old_simulation_data=None,
+            execution_set_threads=None,
             show_graph_attributes=None,
             name=None,
             prefs=None,
@@ -3862,6 +3934,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self.needs_update_controller = True # Tracks if controller needs to update its state_input_ports
         self.needs_determine_node_roles = False # Set in add_node and add_projection to insure update of NodeRoles
         self._need_check_for_unused_projections = True
+        self._execution_plans = None  # Cache of _NodeExecutionPlans, rebuilt after changes to the graph
 
         self.nodes_to_roles = collections.OrderedDict()
         self.cycle_vertices = set()
@@ -3871,6 +3944,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._initialize_parameters(
             **param_defaults,
             retain_old_simulation_data=retain_old_simulation_data,
+            execution_set_threads=execution_set_threads,
             context=context
         )
 
@@ -4035,6 +4109,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._update_shadow_projections(context=context)
         self._check_for_projection_assignments(context=context)
         self.needs_update_graph = False
+        self._execution_plans = None
 
     def _update_processing_graph(self):
         """
@@ -4060,6 +4135,47 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # this determines CYCLE nodes and final FEEDBACK nodes
         self._graph_processing.prune_feedback_edges()
         self.needs_update_graph_processing = False
+        self._execution_plans = None
+
+    def _get_execution_plans(self):
+        """
+        Returns a dict mapping each Node to its `_NodeExecutionPlan`, so that `execute <Composition.execute>` does not
+        need to recompute structural facts about a Node each time it is executed.  The plans are rebuilt whenever
+        the graph has been changed or analyzed since they were last constructed.
+        """
+        if (
+            self._execution_plans is None
+            or self.needs_update_graph
+            or self.needs_update_graph_processing
+            or self.needs_determine_node_roles
+        ):
+            input_nodes = set(self.get_nodes_by_role(NodeRole.INPUT))
+            learning_nodes = set(self.get_nodes_by_role(NodeRole.LEARNING))
+            projections = set(self.projections)
+
+            self._execution_plans = {}
+            for node in self.nodes:
+                if not isinstance(node, Mechanism) or isinstance(node, RecurrentTransferMechanism):
+                    learning_projections = ()
+                else:
+                    learning_projections = tuple(
+                        a
+                        for p in projections.intersection(node.path_afferents)
+                        for a in p.parameter_ports[MATRIX].mod_afferents
+                        if hasattr(a, 'learning_enabled')
+                    )
+                if isinstance(node, Mechanism):
+                    senders = frozenset(p.sender.owner for p in node.afferents)
+                else:
+                    senders = frozenset()
+                self._execution_plans[node] = _NodeExecutionPlan(
+                    is_input=node in input_nodes,
+                    is_learning=node in learning_nodes,
+                    learning_projections=learning_projections,
+                    senders=senders
+                )
+
+        return self._execution_plans
 
     # endregion GRAPH
 
@@ -10085,7 +10201,22 @@ _
                     comp_ex_tags = frozenset({"learning"}) if self._is_learning(context) else frozenset()
                     _comp_ex = pnlvm.CompExecution.get(self, context, additional_tags=comp_ex_tags)
                     if execution_mode & pnlvm.ExecutionMode.LLVM:
-                        results += _comp_ex.run(inputs, num_trials, num_inputs_sets)
+                        # Values do not pass through Parameters during
+                        # compiled runs, so trace the values of nodes
+                        # if any of them are logged, and log them in bulk
+                        log_context = None
+                        phase = context.execution_phase
+                        if any(n.parameters.value.log_condition for n in self._get_trace_nodes()):
+                            log_context = context
+                            context.execution_phase = ContextFlags.PROCESSING
+
+                        # Run in chunks of trials to bound the size of
+                        # input/output buffers for long runs
+                        for chunk_results in _comp_ex.chunked_run(inputs, num_trials, num_inputs_sets,
+                                                                  log_context=log_context):
+                            results += chunk_results
+
+                        context.execution_phase = phase
                     elif execution_mode & pnlvm.ExecutionMode.PTX:
                         results += _comp_ex.cuda_run(inputs, num_trials, num_inputs_sets)
                     else:
@@ -10099,6 +10230,7 @@ _
                         _comp_ex._copy_params_to_pnl(context=context)
 
                     self._propagate_most_recent_context(context)
+                    scheduler.get_clock(context)._increment_time(TimeScale.RUN)
 
                     report(self,
                            [COMPILED_REPORT, PROGRESS_REPORT],
@@ -10505,6 +10637,57 @@ _
                        context=context,
                        node=self.controller)
 
+    def _get_execution_set_threads(self, execution_set, execution_plans, report_output, context):
+        """
+        Returns the number of threads with which to execute the Nodes in **execution_set** concurrently, or 0 if they
+        must be executed one at a time (see `execution_set_threads <Composition.execution_set_threads>`).
+        """
+        threads = self.parameters.execution_set_threads._get(context)
+        if (
+            not threads
+            or threads < 2
+            or len(execution_set) < 2
+            or report_output is not ReportOutput.OFF
+            or self._animate is not False
+            or self._is_learning(context)
+            or threading.current_thread().name.startswith(_EXECUTION_SET_THREAD_PREFIX)
+        ):
+            return 0
+
+        for node in execution_set:
+            if (
+                not isinstance(node, Mechanism)
+                or node is self.controller
+                or not execution_plans[node].senders.isdisjoint(execution_set)
+            ):
+                return 0
+
+        return min(threads, len(execution_set))
+
+    def _complete_node_execution(self, node, plan, frozen_values, new_values, clamp_input, pulse_clamp_inputs,
+                                 context):
+        # ANIMATE node ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        if self._animate is not False and self._animate_unit == COMPONENT:
+            self._animate_execution(node, context)
+
+        # MANAGE INPUTS (for next execution_set)~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+        # FIX: 6/12/19 Deprecate?
+        # Handle input clamping
+        if plan.is_input:
+            if clamp_input:
+                if node in pulse_clamp_inputs:
+                    for input_port in node.input_ports:
+                        # clamp = None --> "turn off" input node
+                        self.input_CIM_ports[input_port][1].parameters.value._set(0, context)
+
+        # Store new value generated by node,
+        #    then set back to frozen value for use by other nodes in execution_set
+        new_values[node] = node.get_output_values(context)
+        for i in range(len(node.output_ports)):
+            node.output_ports[i].parameters.value._set(frozen_values[node][i], context,
+                                                       skip_history=True, skip_log=True)
+
     @handle_external_context(execution_phase=ContextFlags.PROCESSING)
     def execute(
             self,
@@ -10675,6 +10858,7 @@ _
             context.composition = self
 
             input_nodes = self.get_nodes_by_role(NodeRole.INPUT)
+            execution_plans = self._get_execution_plans()
 
             # if execute was called from command line and no inputs were specified,
             # assign default inputs to highest level composition (i.e. not on any nested Compositions)
@@ -10721,6 +10905,13 @@ _
                         _comp_ex = pnlvm.CompExecution.get(self, context)
                         if execution_mode & pnlvm.ExecutionMode.LLVM:
                             _comp_ex.execute(llvm_inputs)
+                            # Values do not pass through Parameters during
+                            # compiled execution, so log them afterwards
+                            if any(n.parameters.value.log_condition for n in self._get_trace_nodes()):
+                                phase = context.execution_phase
+                                context.execution_phase = ContextFlags.PROCESSING
+                                _comp_ex.log_node_values(context)
+                                context.execution_phase = phase
                         elif execution_mode & pnlvm.ExecutionMode.PTX:
                             _comp_ex.cuda_execute(llvm_inputs)
                         else:
@@ -11033,7 +11224,8 @@ _
                 # PURGE LEARNING IF NOT ENABLED ----------------------------------------------------------------
                 # If learning is turned off, check for learning related nodes and remove them from the execution set
                 if not self._is_learning(context):
-                    next_execution_set = next_execution_set - set(self.get_nodes_by_role(NodeRole.LEARNING))
+                    next_execution_set = {node for node in next_execution_set
+                                          if not execution_plans[node].is_learning}
 
                 # Add TIME_STEP header to output report
                 nodes_to_report = any(node.reportOutputPref for node in next_execution_set)
@@ -11058,8 +11250,15 @@ _
                         key=lambda n: execution_scheduler.consideration_queue_indices[n]
                     )
 
+                # Execute the Mechanisms in the set concurrently if possible (see execution_set_threads);
+                #    they are prepared in the loop below and executed after it
+                execution_set_threads = self._get_execution_set_threads(next_execution_set, execution_plans,
+                                                                        report_output, context)
+                deferred_executions = []
+
                 # execute each node with EXECUTING in context
                 for (node_idx, node) in enumerate(next_execution_set):
+                    plan = execution_plans[node]
 
                     node.parameters.num_executions.get(context)._set_by_time_scale(TimeScale.TIME_STEP, 0)
                     if new_pass:
@@ -11072,7 +11271,7 @@ _
 
                     # FIX: 6/12/19 Deprecate?
                     # Handle input clamping
-                    if node in input_nodes:
+                    if plan.is_input:
                         if clamp_input:
                             if node in hard_clamp_inputs:
                                 # clamp = HARD_CLAMP --> "turn off" recurrent projection
@@ -11100,28 +11299,37 @@ _
                         #   for which learning_enabled == True or ONLINE (i.e., not False or AFTER)
                         #   Implementation Note: RecurrentTransferMechanisms are special cased as the
                         #   AutoAssociativeMechanism should be handling learning - not the RTM itself.
-                        if self._is_learning(context) and not isinstance(node, RecurrentTransferMechanism):
-                            projections = set(self.projections).intersection(set(node.path_afferents))
-                            if any([p for p in projections if
-                                    any([a for a in p.parameter_ports[MATRIX].mod_afferents
-                                         if (hasattr(a, 'learning_enabled')
-                                             and a.learning_enabled in {True, ONLINE})])]):
-                                context.replace_flag(ContextFlags.PROCESSING, ContextFlags.LEARNING)
+                        if (
+                            plan.learning_projections
+                            and self._is_learning(context)
+                            and any(a.learning_enabled in {True, ONLINE} for a in plan.learning_projections)
+                        ):
+                            context.replace_flag(ContextFlags.PROCESSING, ContextFlags.LEARNING)
 
                         # Execute Mechanism
                         if execution_mode & pnlvm.ExecutionMode.COMPILED:
-                            _comp_ex.execute_node(node, context=context)
+                            if execution_set_threads:
+                                deferred_executions.append(node)
+                            else:
+                                _comp_ex.execute_node(node, context=context)
                         else:
                             if node is not self.controller:
                                 mech_context = copy(context)
                                 mech_context.source = ContextFlags.COMPOSITION
-                                if nested and node in self.get_nodes_by_role(NodeRole.INPUT):
+                                if nested and plan.is_input:
                                     for port in node.input_ports:
                                         port._update(context=context)
-                                node.execute(context=mech_context,
-                                             report_num=report_num,
-                                             runtime_params=execution_runtime_params,
-                                             )
+                                if execution_set_threads:
+                                    deferred_executions.append(
+                                        functools.partial(node.execute,
+                                                          context=mech_context,
+                                                          runtime_params=execution_runtime_params)
+                                    )
+                                else:
+                                    node.execute(context=mech_context,
+                                                 report_num=report_num,
+                                                 runtime_params=execution_runtime_params,
+                                                 )
 
                         # Set execution_phase for node's context back to IDLE
                         if self._is_learning(context):
@@ -11189,28 +11397,23 @@ _
                                context=context,
                                node=node)
 
-                    # ANIMATE node ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-                    if self._animate is not False and self._animate_unit == COMPONENT:
-                        self._animate_execution(node, context)
+                    if not execution_set_threads:
+                        self._complete_node_execution(node, plan, frozen_values, new_values,
+                                                      clamp_input, pulse_clamp_inputs, context)
 
+                # EXECUTE MECHANISMS CONCURRENTLY ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-                    # MANAGE INPUTS (for next execution_set)~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-
-                    # FIX: 6/12/19 Deprecate?
-                    # Handle input clamping
-                    if node in input_nodes:
-                        if clamp_input:
-                            if node in pulse_clamp_inputs:
-                                for input_port in node.input_ports:
-                                    # clamp = None --> "turn off" input node
-                                    self.input_CIM_ports[input_port][1].parameters.value._set(0, context)
+                if execution_set_threads:
+                    if execution_mode & pnlvm.ExecutionMode.COMPILED:
+                        _comp_ex.execute_nodes(deferred_executions,
+                                               executor=_get_execution_set_pool(execution_set_threads),
+                                               context=context)
+                    else:
+                        _execute_concurrently(deferred_executions, execution_set_threads)
 
-                    # Store new value generated by node,
-                    #    then set back to frozen value for use by other nodes in execution_set
-                    new_values[node] = node.get_output_values(context)
-                    for i in range(len(node.output_ports)):
-                        node.output_ports[i].parameters.value._set(frozen_values[node][i], context,
-                                                                   skip_history=True, skip_log=True)
+                    for node in next_execution_set:
+                        self._complete_node_execution(node, execution_plans[node], frozen_values, new_values,
+                                                      clamp_input, pulse_clamp_inputs, context)
 
                 # Set all nodes to new values
                 for node in next_execution_set:
@@ -11876,17 +12079,17 @@ _
             except AttributeError:
                 self.scheduler._delete_counts(c)
 
-    def _initialize_as_agent_rep(self, context, base_context, alt_controller=None):
+    def _initialize_as_agent_rep(self, context, base_context, alt_controller=None, copy_on_access=False):
         assert self.controller is None or alt_controller is None
 
         _initialized = set()  # avoid reinitializing shared dependencies below
         self._initialize_from_context(
-            context, base_context=base_context, override=True, visited=_initialized
+            context, base_context=base_context, override=True, visited=_initialized, copy_on_access=copy_on_access
         )
         if alt_controller is not None:
             # evaluation will be done with a controller from another composition
             alt_controller._initialize_from_context(
-                context, base_context=base_context, override=True, visited=_initialized
+                context, base_context=base_context, override=True, visited=_initialized, copy_on_access=copy_on_access
             )
 
     def _clean_up_as_agent_rep(self, context, alt_controller=None):
@@ -11954,6 +12157,21 @@ _
         nested_types = (ctx.get_data_struct_type(n) for n in self._all_nodes)
         return pnlvm.ir.LiteralStructType((output_type, *nested_types))
 
+    def _get_trace_nodes(self):
+        # Nodes whose value is recorded by traced compiled runs
+        return [n for n in self.nodes if "value" in n.llvm_state_ids]
+
+    def _get_trace_struct_type(self, ctx):
+        # Value of each traced node at the end of a trial,
+        # followed by the (trial, pass, time_step) of its last execution
+        trace_nodes = self._get_trace_nodes()
+        value_types = (ctx.get_state_struct_type(n).elements[n.llvm_state_ids.index("value")].element
+                       for n in trace_nodes)
+        time_type = pnlvm.ir.ArrayType(ctx.int32_ty, 3)
+        return pnlvm.ir.LiteralStructType((
+            pnlvm.ir.LiteralStructType(value_types),
+            pnlvm.ir.ArrayType(time_type, len(trace_nodes))))
+
     def _get_state_initializer(self, context):
         node_states = (m._get_state_initializer(context=context) for m in self._all_nodes)
         proj_states = (p._get_state_initializer(context=context) for p in self._inner_projections)
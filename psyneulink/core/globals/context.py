@@ -321,9 +321,10 @@ class Context():
       references it, but it is possible that future uses will involve other messages.  Note that this is *not* the
       same as the `flags_string <Context.flags_string>` attribute (see `note <Context_String_Note>`).
 
-    rpc_pipeline : Queue
+    rpc_pipeline : Queue or DeliveryPipeline
       queue to populate with messages for external environment in cases where execution was triggered via RPC call
-      (e.g. through PsyNeuLinkView).
+      (e.g. through PsyNeuLinkView);  a `DeliveryPipeline` batches and serializes the messages off of the execution
+      path (see `Delivery_Overview`).
 
     """
 
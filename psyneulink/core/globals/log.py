@@ -157,6 +157,12 @@ The value of a Component is recorded to a Log when the condition assigned to its
 This is specified as a `LogCondition` or a boolean combination of them (see `Log_Conditions`).  The default LogCondition
 is `OFF`.
 
+When a Composition is executed using `ExecutionMode.LLVMRun` or `ExecutionMode.LLVMExec`, the `value
+<Mechanism_Base.value>` of each of its Mechanisms that is logged is recorded once per `TRIAL <TimeScale.TRIAL>`,
+as it was at the end of the `TRIAL <TimeScale.TRIAL>`, with the time of the Mechanism's last execution in it.
+In `ExecutionMode.LLVMRun`, the values are recorded into a buffer by the compiled run, and entered into the Log
+in bulk after each block of `TRIAL <TimeScale.TRIAL>`\\s.  Other logged items are not recorded in compiled modes.
+
 .. _Log_Examples:
 
 Examples
@@ -380,6 +386,7 @@ Class Reference
 ---------------
 
 """
+import copy
 import enum
 import warnings
 
@@ -505,6 +512,205 @@ def _time_string(time):
     return time_str
 
 
+class _ColumnarLog:
+    """
+        The `LogEntry` items logged for a Parameter in one execution
+        context, stored by column rather than as a deque of tuples:
+        time stamps in a growable (N, `NUM_TIME_SCALES`) integer array,
+        in which -1 stands for a time scale that is None, context
+        strings in a list, and values in a growable array as long as
+        they are numeric scalars or numpy arrays of the same type,
+        shape and dtype. Once a value that does not fit is logged, all
+        values are kept in a list instead.
+
+        Behaves as a sequence of `LogEntry` items; the `stamps` and
+        `value_array` columns let `Log` export functions work on all of
+        the entries at once. Values stored in the array are copies, and
+        are returned as new objects when entries are read.
+    """
+    _initial_capacity = 16
+
+    def __init__(self, iterable=()):
+        self._len = 0
+        self._stamps = np.empty((self._initial_capacity, NUM_TIME_SCALES), dtype=np.int64)
+        self._contexts = []
+        # growable array of values, or list if they cannot be stored in one
+        self._values = None
+        # type of the values stored in self._values if it is an array
+        self._value_type = None
+
+        for entry in iterable:
+            self.append(entry)
+
+    @staticmethod
+    def _fits_array(value):
+        if type(value) is np.ndarray:
+            return value.dtype.kind in 'biufc'
+        return isinstance(value, (int, float, complex, np.number))
+
+    def _can_store(self, value):
+        return (
+            type(value) is self._value_type
+            and np.shape(value) == self._values.shape[1:]
+            and np.asarray(value).dtype == self._values.dtype
+        )
+
+    def _grow(self):
+        capacity = 2 * len(self._stamps)
+
+        stamps = np.empty((capacity, NUM_TIME_SCALES), dtype=self._stamps.dtype)
+        stamps[:self._len] = self._stamps[:self._len]
+        self._stamps = stamps
+
+        if isinstance(self._values, np.ndarray):
+            values = np.empty((capacity, *self._values.shape[1:]), dtype=self._values.dtype)
+            values[:self._len] = self._values[:self._len]
+            self._values = values
+
+    def _value_at(self, index):
+        if not isinstance(self._values, np.ndarray):
+            return self._values[index]
+        elif self._value_type is np.ndarray:
+            return np.array(self._values[index])
+        else:
+            return self._value_type(self._values[index])
+
+    def append(self, entry):
+        time, context, value = entry
+
+        if self._len == len(self._stamps):
+            self._grow()
+
+        if self._values is None:
+            if self._fits_array(value):
+                value_array = np.asarray(value)
+                self._values = np.empty((len(self._stamps), *value_array.shape), dtype=value_array.dtype)
+                self._value_type = type(value)
+            else:
+                self._values = []
+        elif isinstance(self._values, np.ndarray) and not self._can_store(value):
+            self._values = [self._value_at(i) for i in range(self._len)]
+            self._value_type = None
+
+        if time is None:
+            self._stamps[self._len] = -1
+        else:
+            self._stamps[self._len] = [-1 if t is None else t for t in time]
+        self._contexts.append(context)
+        if isinstance(self._values, np.ndarray):
+            self._values[self._len] = value
+        else:
+            self._values.append(value)
+        self._len += 1
+
+    def append_columns(self, stamps, context, values):
+        """
+            Append an entry for each row of **stamps** and item of
+            **values**, all with the same **context**, without creating
+            `LogEntry` items. Stamps use -1 for time scales that are None.
+        """
+        num_entries = len(stamps)
+
+        if (
+            isinstance(values, np.ndarray)
+            and values.dtype.kind in 'biufc'
+            and (
+                self._values is None
+                or self._value_type is np.ndarray
+                and self._values.shape[1:] == values.shape[1:]
+                and self._values.dtype == values.dtype
+            )
+        ):
+            if self._values is None:
+                self._values = np.empty((len(self._stamps), *values.shape[1:]), dtype=values.dtype)
+                self._value_type = np.ndarray
+            while self._len + num_entries > len(self._stamps):
+                self._grow()
+
+            self._stamps[self._len:self._len + num_entries] = stamps
+            self._values[self._len:self._len + num_entries] = values
+            self._contexts.extend([context] * num_entries)
+            self._len += num_entries
+        else:
+            for stamp, value in zip(np.asarray(stamps).tolist(), values):
+                self.append(LogEntry(time_object(*[None if t < 0 else t for t in stamp]), context, value))
+
+    def clear(self):
+        self.__init__()
+
+    @property
+    def stamps(self):
+        """(N, `NUM_TIME_SCALES`) array of the time stamps of the entries, with -1 for time scales that are None"""
+        return self._stamps[:self._len]
+
+    @property
+    def value_array(self):
+        """array of the values of the entries, or None if they are not stored in an array"""
+        if isinstance(self._values, np.ndarray):
+            return self._values[:self._len]
+        return None
+
+    def values_tolist(self, rows=None):
+        """
+            Return the values of the entries at **rows** (all entries if
+            None) converted by numpy.ndarray.tolist; values that are
+            None remain None.
+        """
+        value_array = self.value_array
+        if value_array is not None:
+            return (value_array if rows is None else value_array[rows]).tolist()
+
+        values = self._values if rows is None else [self._values[i] for i in rows]
+        return [None if v is None else np.array(v).tolist() for v in values]
+
+    def _entry_at(self, index):
+        return LogEntry(
+            time_object(*[None if t < 0 else t for t in self._stamps[index].tolist()]),
+            self._contexts[index],
+            self._value_at(index)
+        )
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry_at(i) for i in range(*index.indices(self._len))]
+
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f'{type(self).__name__} index out of range')
+
+        return self._entry_at(index)
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self._entry_at(i)
+
+    def __copy__(self):
+        # a copy cannot share the growable arrays of the original
+        return copy.deepcopy(self)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r})'
+
+
+def _time_stamp_shape(time_values):
+    """Return the shape of an index space that holds every time stamp in **time_values**"""
+    return tuple(time_values.max(axis=0) + 1)
+
+
+def _time_stamp_keys(stamps, shape):
+    """Return an integer key for each time stamp in **stamps**; keys sort in the same order as the time stamps"""
+    return np.ravel_multi_index(stamps.T, shape)
+
+
+def _as_columnar_log(entries):
+    """Return **entries**, a sequence of `LogEntry` items, as a `_ColumnarLog`"""
+    return entries if isinstance(entries, _ColumnarLog) else _ColumnarLog(entries)
+
+
 #region Custom Entries Dict
 # Modified from: http://stackoverflow.com/questions/7760916/correct-useage-of-getter-setter-for-dictionary-values
 class EntriesDict(MutableMapping,dict):
@@ -1394,9 +1600,9 @@ class Log:
 
             data_entry = []
             # Create time rows (one for each time scale)
-            if time_values:
+            if len(time_values):
                 for i in range(NUM_TIME_SCALES):
-                    row = [[t[i]] for t in time_values]
+                    row = time_values[:, i:i + 1].tolist()
                     if header:
                         time_header = [TIME_SCALE_NAMES[i].capitalize()]
                         row = [time_header] + row
@@ -1513,9 +1719,9 @@ class Log:
             log_dict[eid] = OrderedDict()
 
             # If all time values are recorded - - - log_dict = {"Run": array, "Trial": array, "Time_step": array}
-            if time_values:
+            if len(time_values):
                 for i in range(NUM_TIME_SCALES):
-                    row = [[t[i]] for t in time_values]
+                    row = time_values[:, i:i + 1].tolist()
                     time_header = TIME_SCALE_NAMES[i].capitalize()
                     log_dict[eid][time_header] = row
 
@@ -1531,7 +1737,13 @@ class Log:
                 log_dict[eid]["Index"] = np.arange(num_indicies).reshape(num_indicies, 1).tolist()
 
             for entry in entries:
-                log_dict[eid][entry] = np.array(self._assemble_entry_data(entry, time_values, eid))
+                row = self._assemble_entry_data(entry, time_values, eid)
+                if any(value is None for value in row):
+                    # an entry not logged at every time is ragged, so keep its values as objects
+                    log_dict[eid][entry] = np.empty(len(row), dtype=object)
+                    log_dict[eid][entry][:] = [None if value is None else np.array(value) for value in row]
+                else:
+                    log_dict[eid][entry] = np.array(row)
 
         return log_dict
 
@@ -1715,37 +1927,23 @@ class Log:
         return mod_time_values
 
     def _parse_entries_for_time_values(self, entries, execution_id=None):
-        # Returns sorted list of SimpleTime tuples for all time points at which these entries logged values
+        # Returns (N, NUM_TIME_SCALES) array of the sorted, unique time stamps at which these entries logged values
+        # Time stamps with a time scale that is None are excluded
 
-        time_values = []
+        time_values = [np.empty((0, NUM_TIME_SCALES), dtype=np.int64)]
+        logged_entries = self.get_logged_entries(contexts=[execution_id])
         for entry in entries:
-            # OLD: finds duplicate time points within any one entry and modifies their values to be unique
-            #
-            # # collect all time values for this entry
-            # entry_time_values = []
-            # entry_time_values.extend([item.time for item in self.logged_entries[entry] if all(i is not None for i in item.time)])
-
-            # # increment any time stamp duplicates (on the actual data item)
-            # if len(set(entry_time_values)) != len(entry_time_values):
-            #     adjusted_time = self._scan_for_duplicates(entry_time_values)
-            #     for i in range(len(self.logged_entries[entry])):
-            #         temp_list = list(self.logged_entries[entry][i])
-            #         temp_list[0] = adjusted_time[i]
-            #         self.logged_entries[entry][i] = LogEntry(temp_list[0], temp_list[1], temp_list[2])
-
-            logged_entries_for_param = self.get_logged_entries(contexts=[execution_id])
-            # make sure param exists in logged entries
-            logged_entries_for_param = logged_entries_for_param.get(entry) if logged_entries_for_param else None
-            # make sure execution id exists in logged entries of param
-            logged_entries_for_param = logged_entries_for_param.get(execution_id) if logged_entries_for_param else None
-            if logged_entries_for_param:
-                time_values.extend([item.time
-                                    for item in logged_entries_for_param
-                                    if all(i is not None for i in item.time)])
-
-        # Insure that all time values are assigned, get rid of duplicates, and sort
-        if all(all(i is not None for i in t) for t in time_values):
-            time_values = sorted(list(set(time_values)))
+            try:
+                stamps = _as_columnar_log(logged_entries[entry][execution_id]).stamps
+            except KeyError:
+                continue
+            time_values.append(stamps[(stamps >= 0).all(axis=1)])
+        time_values = np.concatenate(time_values)
+
+        if len(time_values):
+            shape = _time_stamp_shape(time_values)
+            keys = np.unique(_time_stamp_keys(time_values, shape))
+            time_values = np.stack(np.unravel_index(keys, shape), axis=1)
 
         return time_values
 
@@ -1755,44 +1953,52 @@ class Log:
         # If data was not recorded for this entry (component) for a given time point, it will be stored as None
 
         # entry = self._dealias_owner_name(entry)
-        row = []
-        time_col = iter(time_values)
         try:
-            data = self.logged_entries[entry][execution_id]
+            data = _as_columnar_log(self.logged_entries[entry][execution_id])
         except KeyError:
             return [None]
 
-        time = next(time_col, None)
-        for i in range(len(self.logged_entries[entry][execution_id])):
-            # iterate through log entry tuples:
-            # check whether the next tuple's time value matches the time for which data is currently being recorded
-            # if not, check whether the current tuple's time value matches the time for which data is being recorded
-            # if so, enter tuple's Component value in the entry's list
-            # if not, enter `None` in the entry's list
-            datum = data[i]
-            if time_values:
-                if i == len(data) - 1 or data[i + 1].time != time:
-                    if datum.time != time:
-                        row.append(None)
-                    else:
-                        value = None if datum.value is None else np.array(datum.value).tolist()  # else, if is time,
-                        # append value
-                        row.append(value)
-                    time = next(time_col, None)  # increment time value
-                    if time is None:  # if no more times, break
-                        break
+        if len(time_values):
+            stamps = data.stamps
+            data_rows = np.flatnonzero((stamps >= 0).all(axis=1))
+
+            # find the index in time_values (which includes every time stamp of data) of each data item's time stamp
+            shape = _time_stamp_shape(time_values)
+            time_indices = np.searchsorted(
+                _time_stamp_keys(time_values, shape),
+                _time_stamp_keys(stamps[data_rows], shape)
+            )
+
+            # keep only the last data item at each time point
+            if np.any(np.diff(time_indices) <= 0):
+                time_indices, last = np.unique(time_indices[::-1], return_index=True)
+                data_rows = data_rows[::-1][last]
+
+            row = [None] * len(time_values)
+            for i, value in zip(time_indices.tolist(), data.values_tolist(data_rows)):
+                row[i] = value
+            return row
+
+        value_array = data.value_array
+        if value_array is not None:
+            if value_array.ndim == 1:
+                # values are scalars, so put each in a list
+                value_array = value_array.reshape(-1, 1)
+            return value_array.tolist()
+
+        row = []
+        for datum in data:
+            if datum.value is None:
+                value = None
+            elif isinstance(datum.value, list):
+                value = datum.value
+            elif np.array(datum.value).shape == ():
+                # converted value is a scalar, so a call to np.array(datum.value).tolist() would return a scalar
+                value = [datum.value]
             else:
-                if datum.value is None:
-                    value = None
-                elif isinstance(datum.value, list):
-                    value = datum.value
-                elif np.array(datum.value).shape == ():
-                    # converted value is a scalar, so a call to np.array(datum.value).tolist() would return a scalar
-                    value = [datum.value]
-                else:
-                    value = np.array(datum.value).tolist()
+                value = np.array(datum.value).tolist()
 
-                row.append(value)
+            row.append(value)
         return row
 
     @property
@@ -309,17 +309,20 @@ import functools
 import inspect
 import itertools
 import logging
+import sys
 import types
 import typing
 import weakref
 
+import numpy as np
 import toposort
 
 from psyneulink.core.globals.context import Context, ContextError, ContextFlags, _get_time, handle_external_context
 from psyneulink.core.globals.context import time as time_object
-from psyneulink.core.globals.log import LogCondition, LogEntry, LogError
+from psyneulink.core.globals.log import LogCondition, LogEntry, LogError, _ColumnarLog
 from psyneulink.core.globals.utilities import call_with_pruned_args, copy_iterable_with_shared, \
     get_alias_property_getter, get_alias_property_setter, get_deepcopy_with_shared, unproxy_weakproxy, create_union_set, safe_equals, get_function_sig_default_value
+from psyneulink.core.rpc.delivery import DeliveryPipeline
 from psyneulink.core.rpc.graph_pb2 import Entry, ndArray
 
 __all__ = [
@@ -404,6 +407,176 @@ def copy_parameter_value(value, shared_types=None, memo=None):
             return value
 
 
+
+class _CopyOnAccess:
+    """
+        Placeholder for a Parameter value initialized from another
+        context (see `Parameter._initialize_from_context`). Holds a
+        reference to the value in the base context, which is copied
+        only when the value is first accessed in the new context.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def copy(self):
+        from psyneulink.core.components.component import Component, ComponentsMeta
+
+        shared_types = (Component, ComponentsMeta, types.MethodType, types.ModuleType)
+
+        if isinstance(self.value, (dict, list)):
+            return copy_iterable_with_shared(self.value, shared_types)
+        elif not isinstance(self.value, shared_types):
+            return copy.deepcopy(self.value)
+        else:
+            return self.value
+
+
+class _ParameterValues(dict):
+    """
+        A dict of Parameter values by execution_id that resolves
+        `_CopyOnAccess` entries the first time they are retrieved
+    """
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, _CopyOnAccess):
+            value = value.copy()
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        self._resolve_all()
+        return super().items()
+
+    def values(self):
+        self._resolve_all()
+        return super().values()
+
+    def _get_unresolved(self, key):
+        """
+            Returns the stored value for **key** without copying it,
+            unwrapping a `_CopyOnAccess` to the base context value
+        """
+        value = super().__getitem__(key)
+        if isinstance(value, _CopyOnAccess):
+            value = value.value
+        return value
+
+    def _resolve_all(self):
+        for key in list(self.keys()):
+            self[key]
+
+
+class _ArrayHistory:
+    """
+        A fixed-length history of numpy arrays of the same shape and
+        dtype, stored in a preallocated buffer and used in place of a
+        collections.deque when `Parameter.history_as_array` is True.
+
+        Every entry is written twice, at positions *i* and
+        *i* + **maxlen**, so that any range of consecutive entries is
+        a contiguous slice of the buffer and can be returned as a view.
+        Views are overwritten as new entries are appended.
+    """
+    def __init__(self, iterable, maxlen, shape, dtype):
+        self.maxlen = maxlen
+        self._buffer = np.empty((2 * maxlen, *shape), dtype=dtype)
+        self._start = 0
+        self._len = 0
+
+        for value in iterable:
+            self.append(value)
+
+    @classmethod
+    def accepts(cls, value):
+        return isinstance(value, np.ndarray) and value.dtype != object
+
+    @property
+    def shape(self):
+        return self._buffer.shape[1:]
+
+    @property
+    def dtype(self):
+        return self._buffer.dtype
+
+    def can_append(self, value):
+        return (
+            isinstance(value, np.ndarray)
+            and value.shape == self.shape
+            and value.dtype == self.dtype
+        )
+
+    def append(self, value):
+        if self.maxlen == 0:
+            return
+
+        if self._len < self.maxlen:
+            pos = (self._start + self._len) % self.maxlen
+            self._len += 1
+        else:
+            pos = self._start
+            self._start = (self._start + 1) % self.maxlen
+
+        self._buffer[pos] = value
+        self._buffer[pos + self.maxlen] = value
+
+    def clear(self):
+        self._start = 0
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def _entries(self):
+        return self._buffer[self._start:self._start + self._len]
+
+    def __iter__(self):
+        return iter(self._entries())
+
+    def __getitem__(self, index):
+        return self._entries()[index]
+
+    def __copy__(self):
+        # entries are stored by value, so a copy cannot share the buffer
+        return copy.deepcopy(self)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r}, maxlen={self.maxlen})'
+
+
+def _get_value_size(value, visited=None):
+    """
+        Returns the approximate number of bytes used by **value**,
+        including the contents of containers. Components are shared
+        between contexts and values not yet copied from a base context
+        (`_CopyOnAccess`) do not use memory of their own, so neither
+        is counted.
+    """
+    from psyneulink.core.components.component import Component, ComponentsMeta
+
+    if visited is None:
+        visited = set()
+
+    if id(value) in visited or isinstance(value, (_CopyOnAccess, Component, ComponentsMeta)):
+        return 0
+    visited.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_get_value_size(k, visited) + _get_value_size(v, visited) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, collections.deque)):
+        size += sum(_get_value_size(v, visited) for v in value)
+
+    return size
+
+
 def get_init_signature_default_value(obj, parameter):
     """
         Returns:
@@ -503,7 +676,9 @@ class ParametersTemplate:
             self._parent._children.add(weakref.ref(self))
 
         # create list of params currently existing
-        self._params = set()
+        # (dict is used as an insertion ordered set to keep the iteration
+        # order independent of string hashing)
+        self._params = {}
         try:
             parent_keys = list(self._parent._params)
         except AttributeError:
@@ -511,7 +686,7 @@ class ParametersTemplate:
         source_keys = dir(self) + parent_keys
         for k in source_keys:
             if self._is_parameter(k):
-                self._params.add(k)
+                self._params[k] = None
 
         self._children = set()
 
@@ -554,7 +729,7 @@ class ParametersTemplate:
                 return True
 
     def _register_parameter(self, param_name):
-        self._params.add(param_name)
+        self._params[param_name] = None
         to_remove = set()
 
         for child in self._children:
@@ -822,9 +997,11 @@ class Parameter(ParameterBase):
             :default: True
 
         log
-            stores the log of the parameter if applicable.
+            stores the log of the parameter if applicable. The entries for
+            each execution_id are kept in a columnar store that behaves as a
+            sequence of LogEntry items.
 
-            :type: dict{execution_id: deque([LogEntry])}
+            :type: dict{execution_id: sequence([LogEntry])}
             :default: None
 
         log_condition
@@ -856,6 +1033,17 @@ class Parameter(ParameterBase):
 
             :default: 0
 
+        history_as_array
+            if True, the history of a value that is a numpy array of fixed
+            shape and numeric dtype is stored in a preallocated buffer
+            of `history_max_length` entries instead of a deque of array
+            objects. New entries are copied into the buffer, and
+            `get_previous` returns views into it, which are overwritten
+            once `history_max_length` newer values have been set. Values
+            of any other kind are stored in a deque as usual.
+
+            :default: False
+
         fallback_default
             if False, the Parameter will return None if a requested value is not present for a given execution context;
             if True, the Parameter's default_value will be returned instead.
@@ -943,6 +1131,7 @@ class Parameter(ParameterBase):
     # (see _set_history_max_length)
     _additional_param_attr_properties = {
         'default_value',
+        'history_as_array',
         'history_max_length',
         'log_condition',
         'spec',
@@ -971,6 +1160,7 @@ class Parameter(ParameterBase):
         history=None,
         history_max_length=1,
         history_min_length=0,
+        history_as_array=False,
         fallback_default=False,
         retain_old_simulation_data=False,
         constructor_argument=None,
@@ -997,7 +1187,9 @@ class Parameter(ParameterBase):
             aliases = [aliases]
 
         if values is None:
-            values = {}
+            values = _ParameterValues()
+        elif not isinstance(values, _ParameterValues):
+            values = _ParameterValues(values)
 
         if history is None:
             history = {}
@@ -1036,6 +1228,7 @@ class Parameter(ParameterBase):
             history=history,
             history_max_length=history_max_length,
             history_min_length=history_min_length,
+            history_as_array=history_as_array,
             fallback_default=fallback_default,
             retain_old_simulation_data=retain_old_simulation_data,
             constructor_argument=constructor_argument,
@@ -1395,7 +1588,10 @@ class Parameter(ParameterBase):
 
         if range_start is not None or range_end is not None:
             try:
-                return list(self.history[context.execution_id])[range_start:range_end]
+                history = self.history[context.execution_id]
+                if isinstance(history, _ArrayHistory):
+                    return history[range_start:range_end]
+                return list(history)[range_start:range_end]
             except (KeyError, IndexError):
                 return None
         else:
@@ -1504,10 +1700,18 @@ class Parameter(ParameterBase):
         # store history
         if not skip_history:
             if execution_id in self.values:
+                # a value that was never accessed in this context does not
+                # need to be copied just to be moved to history, which,
+                # like history copied from a base context, is not modified
+                old_value = self.values._get_unresolved(execution_id)
                 try:
-                    self.history[execution_id].append(self.values[execution_id])
+                    history = self.history[execution_id]
                 except KeyError:
-                    self.history[execution_id] = collections.deque([self.values[execution_id]], maxlen=self.history_max_length)
+                    self.history[execution_id] = self._create_history([old_value])
+                else:
+                    if isinstance(history, _ArrayHistory) and not history.can_append(old_value):
+                        history = self.history[execution_id] = collections.deque(history, maxlen=self.history_max_length)
+                    history.append(old_value)
 
         if self.loggable:
             # log value
@@ -1520,6 +1724,23 @@ class Parameter(ParameterBase):
         # set value
         self.values[execution_id] = value
 
+    @handle_external_context()
+    def get_memory_usage(self, context=None):
+        """
+            Returns the approximate number of bytes used by the value of
+            this `Parameter` in the context of **context**. A value that
+            has not yet been copied from the context this context was
+            initialized from does not count (see
+            `Parameter._initialize_from_context`). History is not
+            included because its entries are shared between contexts.
+        """
+        execution_id = context.execution_id if self.stateful else None
+
+        try:
+            return _get_value_size(dict.__getitem__(self.values, execution_id))
+        except KeyError:
+            return 0
+
     @handle_external_context()
     def delete(self, context=None):
         try:
@@ -1572,12 +1793,34 @@ class Parameter(ParameterBase):
                 execution_id = context.execution_id
 
             if execution_id not in self.log:
-                self.log[execution_id] = collections.deque([])
+                self.log[execution_id] = _ColumnarLog()
 
             self.log[execution_id].append(
                 LogEntry(time, context_str, value)
             )
 
+    def _log_values(self, values, times, context):
+        # Logs values computed outside of Python execution (e.g. by a
+        # compiled run) in bulk. times holds a (run, trial, pass,
+        # time_step) row for each value
+        if self.log_condition is None or self.log_condition is LogCondition.OFF:
+            return
+
+        if not self.log_condition & context.flags or len(times) == 0:
+            return
+
+        if not self.stateful:
+            execution_id = None
+        else:
+            execution_id = context.execution_id
+
+        if execution_id not in self.log:
+            self.log[execution_id] = _ColumnarLog()
+
+        self.log[execution_id].append_columns(
+            times, ContextFlags._get_context_string(context.flags), values
+        )
+
     def _deliver_value(self, value, context=None):
         # if a context is attached and a pipeline is attached to the context
         if context and context.rpc_pipeline:
@@ -1609,19 +1852,26 @@ class Parameter(ParameterBase):
                     execution_id = None
                 else:
                     execution_id = context.execution_id
-                # ADD TO PIPELINE HERE
-                context.rpc_pipeline.put(
-                    Entry(
-                        componentName=self._get_root_owner().name,
-                        parameterName=self._get_root_parameter().name,
-                        time=f'{time.run}:{time.trial}:{time.pass_}:{time.time_step}',
-                        context=execution_id,
-                        value=ndArray(
-                            shape=list(value.shape),
-                            data=list(value.flatten())
+                component_name = self._get_root_owner().name
+                parameter_name = self._get_root_parameter().name
+
+                # a DeliveryPipeline serializes batches of values off of
+                # the execution path; other pipelines receive Entries
+                if isinstance(context.rpc_pipeline, DeliveryPipeline):
+                    context.rpc_pipeline.deliver(component_name, parameter_name, time, execution_id, value)
+                else:
+                    context.rpc_pipeline.put(
+                        Entry(
+                            componentName=component_name,
+                            parameterName=parameter_name,
+                            time=f'{time.run}:{time.trial}:{time.pass_}:{time.time_step}',
+                            context=execution_id,
+                            value=ndArray(
+                                shape=list(value.shape),
+                                data=value.ravel().tolist()
+                            )
                         )
                     )
-                )
 
     def _get_root_owner(self):
         owner = self
@@ -1687,18 +1937,27 @@ class Parameter(ParameterBase):
             except KeyError:
                 pass
 
-    def _initialize_from_context(self, context=None, base_context=Context(execution_id=None), override=True):
-        from psyneulink.core.components.component import Component, ComponentsMeta
-
+    def _initialize_from_context(self, context=None, base_context=Context(execution_id=None), override=True, copy_on_access=False):
+        """
+            Sets the value and history of this Parameter in **context**
+            to copies of those in **base_context**.
+
+            If **copy_on_access** is True, the value is not copied
+            until it is first retrieved in **context**, and is not
+            copied at all if it is first overwritten. This is only safe
+            if the value in **base_context** is not modified in place
+            while **context** is in use, as for the frozen contexts
+            used to set up simulations.
+        """
         try:
             try:
-                cur_val = self.values[context.execution_id]
+                cur_val = self.values._get_unresolved(context.execution_id)
             except KeyError:
                 cur_val = None
 
             if cur_val is None or override:
                 try:
-                    new_val = self.values[base_context.execution_id]
+                    new_val = self.values._get_unresolved(base_context.execution_id)
                 except KeyError:
                     return
 
@@ -1707,12 +1966,9 @@ class Parameter(ParameterBase):
                 except KeyError:
                     new_history = NotImplemented
 
-                shared_types = (Component, ComponentsMeta, types.MethodType, types.ModuleType)
-
-                if isinstance(new_val, (dict, list)):
-                    new_val = copy_iterable_with_shared(new_val, shared_types)
-                elif not isinstance(new_val, shared_types):
-                    new_val = copy.deepcopy(new_val)
+                new_val = _CopyOnAccess(new_val)
+                if not copy_on_access:
+                    new_val = new_val.copy()
 
                 self.values[context.execution_id] = new_val
 
@@ -1739,7 +1995,24 @@ class Parameter(ParameterBase):
             raise ParameterError(f'Parameter {self._owner._owner}.{self.name} requires history of length at least {self.history_min_length}.')
         super().__setattr__('history_max_length', value)
         for execution_id in self.history:
-            self.history[execution_id] = collections.deque(self.history[execution_id], maxlen=value)
+            self.history[execution_id] = self._create_history(self.history[execution_id])
+
+    def _set_history_as_array(self, value):
+        super().__setattr__('history_as_array', value)
+        for execution_id in self.history:
+            self.history[execution_id] = self._create_history(self.history[execution_id])
+
+    def _create_history(self, entries):
+        entries = list(entries)
+
+        if self.history_as_array and len(entries) > 0 and _ArrayHistory.accepts(entries[-1]):
+            history = _ArrayHistory([], self.history_max_length, entries[-1].shape, entries[-1].dtype)
+            if all(history.can_append(e) for e in entries):
+                for e in entries:
+                    history.append(e)
+                return history
+
+        return collections.deque(entries, maxlen=self.history_max_length)
 
     def _set_log_condition(self, value):
         if not isinstance(value, LogCondition):
@@ -241,7 +241,7 @@ _ptx_engine = None
 def _get_engines():
     global _cpu_engine
     if _cpu_engine is None:
-        _cpu_engine = cpu_jit_engine()
+        _cpu_engine = cpu_jit_engine(jit_object_cache.from_debug_env())
 
     global _ptx_engine
     if ptx_enabled:
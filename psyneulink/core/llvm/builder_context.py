@@ -46,7 +46,7 @@ def module_count():
         s = LLVMBuilderContext.get_current()
         print("Total generations by global context: {}".format(s._llvm_generation))
         print("Object cache in global context: {} hits, {} misses".format(s._stats["cache_requests"] - s._stats["cache_misses"], s._stats["cache_misses"]))
-        for stat in ("input", "output", "param", "state", "data"):
+        for stat in ("input", "output", "param", "state", "data", "trace"):
             gen_stat = s._stats[stat + "_structs_generated"]
             print("Total {} structs generated by global context: {}".format(stat, gen_stat))
         print("Total python types converted by global context: {}".format(s._stats["types_converted"]))
@@ -107,6 +107,7 @@ class LLVMBuilderContext:
                         "data_structs_generated":0,
                         "input_structs_generated":0,
                         "output_structs_generated":0,
+                        "trace_structs_generated":0,
                       }
         self.float_ty = float_ty
         self.init_builtins()
@@ -204,7 +205,7 @@ class LLVMBuilderContext:
         return self.module.declare_intrinsic("llvm." + name, args, function_type)
 
     def create_llvm_function(self, args, component, name=None, *, return_type=ir.VoidType(), tags:frozenset=frozenset()):
-        name = "_".join((str(component), *tags)) if name is None else name
+        name = "_".join((str(component), *sorted(tags))) if name is None else name
 
         # Builtins are already unique and need to keep their special name
         func_name = name if name.startswith(_BUILTIN_PREFIX) else self.get_unique_name(name)
@@ -400,6 +401,11 @@ class LLVMBuilderContext:
 
         return ir.LiteralStructType([])
 
+    @_comp_cached
+    def get_trace_struct_type(self, component):
+        self._stats["trace_structs_generated"] += 1
+        return component._get_trace_struct_type(self)
+
     def get_node_wrapper(self, composition, node):
         cache = getattr(composition, '_node_wrappers', None)
         if cache is None:
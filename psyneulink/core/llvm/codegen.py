@@ -754,7 +754,7 @@ def gen_node_wrapper(ctx, composition, node, *, tags:frozenset):
 def _gen_composition_exec_context(ctx, composition, *, tags:frozenset, suffix="", extra_args=[]):
     cond_gen = helpers.ConditionGenerator(ctx, composition)
 
-    name = "_".join(("wrap_exec", *tags ,composition.name + suffix))
+    name = "_".join(("wrap_exec", *sorted(tags), composition.name + suffix))
     args = [ctx.get_state_struct_type(composition).as_pointer(),
             ctx.get_param_struct_type(composition).as_pointer(),
             ctx.get_input_struct_type(composition).as_pointer(),
@@ -995,7 +995,15 @@ def gen_composition_exec(ctx, composition, *, tags:frozenset):
 def gen_composition_run(ctx, composition, *, tags:frozenset):
     assert "run" in tags
     simulation = "simulation" in tags
-    name = "_".join(("wrap",  *tags, composition.name))
+    # Chunked run keeps the scheduler state in a caller provided structure,
+    # so that a single RUN can be split across multiple invocations.
+    chunked = "chunked" in tags
+    # Traced run records the value of every traced node at the end of each
+    # trial, and the time of its last execution, in a caller provided buffer.
+    trace = "trace" in tags
+    name = "_".join(("wrap",  *sorted(tags), composition.name))
+    cond_gen = helpers.ConditionGenerator(ctx, composition)
+    cond_type = cond_gen.get_condition_struct_type()
     args = [ctx.get_state_struct_type(composition).as_pointer(),
             ctx.get_param_struct_type(composition).as_pointer(),
             ctx.get_data_struct_type(composition).as_pointer(),
@@ -1003,12 +1011,16 @@ def gen_composition_run(ctx, composition, *, tags:frozenset):
             ctx.get_output_struct_type(composition).as_pointer(),
             ctx.int32_ty.as_pointer(),
             ctx.int32_ty.as_pointer()]
+    if chunked:
+        args.append(cond_type.as_pointer())
+    if trace:
+        args.append(ctx.get_trace_struct_type(composition).as_pointer())
     builder = ctx.create_llvm_function(args, composition, name)
     llvm_func = builder.function
     for a in llvm_func.args:
         a.attributes.add('noalias')
 
-    state, params, data, data_in, data_out, trials_ptr, inputs_ptr = llvm_func.args
+    state, params, data, data_in, data_out, trials_ptr, inputs_ptr = llvm_func.args[:7]
 
     nodes_states = helpers.get_state_ptr(builder, composition, state, "nodes")
 
@@ -1039,19 +1051,30 @@ def gen_composition_run(ctx, composition, *, tags:frozenset):
         builder.store(data_in.type.pointee(input_init), data_in)
         builder.store(inputs_ptr.type.pointee(1), inputs_ptr)
 
-    # Reset internal 'RUN' clocks of each node
-    for idx, node in enumerate(composition._all_nodes):
-        node_state = builder.gep(state, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(idx)])
-        num_executions_ptr = helpers.get_state_ptr(builder, node, node_state, "num_executions")
-        num_exec_time_ptr = builder.gep(num_executions_ptr, [ctx.int32_ty(0), ctx.int32_ty(TimeScale.RUN.value)])
-        builder.store(num_exec_time_ptr.type.pointee(0), num_exec_time_ptr)
+    if chunked:
+        # Use the provided condition structure.
+        # Internal 'RUN' clocks are only reset at the start of the RUN
+        # (the condition structure is initialized for every RUN by the caller)
+        cond = llvm_func.args[7]
+        trial_ptr = builder.gep(cond, [ctx.int32_ty(0), ctx.int32_ty(0),
+                                       ctx.int32_ty(0), ctx.int32_ty(0)])
+        run_start = builder.icmp_signed("==", builder.load(trial_ptr), ctx.int32_ty(0))
+    else:
+        run_start = ctx.bool_ty(1)
 
-    # Allocate and initialize condition structure
-    cond_gen = helpers.ConditionGenerator(ctx, composition)
-    cond_type = cond_gen.get_condition_struct_type()
-    cond = builder.alloca(cond_type, name="scheduler_metadata")
-    cond_init = cond_type(cond_gen.get_condition_initializer())
-    builder.store(cond_init, cond)
+    with builder.if_then(run_start):
+        # Reset internal 'RUN' clocks of each node
+        for idx, node in enumerate(composition._all_nodes):
+            node_state = builder.gep(state, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(idx)])
+            num_executions_ptr = helpers.get_state_ptr(builder, node, node_state, "num_executions")
+            num_exec_time_ptr = builder.gep(num_executions_ptr, [ctx.int32_ty(0), ctx.int32_ty(TimeScale.RUN.value)])
+            builder.store(num_exec_time_ptr.type.pointee(0), num_exec_time_ptr)
+
+    if not chunked:
+        # Allocate and initialize condition structure
+        cond = builder.alloca(cond_type, name="scheduler_metadata")
+        cond_init = cond_type(cond_gen.get_condition_initializer())
+        builder.store(cond_init, cond)
 
     trials = builder.load(trials_ptr, "trials")
     iters_ptr = builder.alloca(trials.type, name="iterations")
@@ -1091,10 +1114,26 @@ def gen_composition_run(ctx, composition, *, tags:frozenset):
     data_in_ptr = builder.gep(data_in, [input_idx])
 
     # Call execution
-    exec_tags = tags.difference({"run"})
+    exec_tags = tags.difference({"run", "chunked", "trace"})
     exec_f = ctx.import_llvm_function(composition, tags=exec_tags)
     builder.call(exec_f, [state, params, data_in_ptr, data, cond])
 
+    if trace:
+        trace_ptr = builder.gep(llvm_func.args[-1], [iters])
+        for idx, node in enumerate(composition._get_trace_nodes()):
+            node_state = builder.gep(nodes_states, [ctx.int32_ty(0),
+                                                    ctx.int32_ty(composition._get_node_index(node))])
+            value_ptr = helpers.get_state_ptr(builder, node, node_state, "value")
+            trace_value_ptr = builder.gep(trace_ptr, [ctx.int32_ty(0), ctx.int32_ty(0),
+                                                      ctx.int32_ty(idx)])
+            builder.store(builder.load(value_ptr), trace_value_ptr)
+
+            node_ts = cond_gen.get_node_ts(builder, cond, node)
+            for i in range(len(node_ts.type)):
+                trace_ts_ptr = builder.gep(trace_ptr, [ctx.int32_ty(0), ctx.int32_ty(1),
+                                                       ctx.int32_ty(idx), ctx.int32_ty(i)])
+                builder.store(builder.extract_value(node_ts, i), trace_ts_ptr)
+
     if not simulation:
         # Extract output_CIM result
         idx = composition._get_node_index(composition.output_CIM)
@@ -33,6 +33,13 @@ Compilation modifiers:
  * "opt" -- Set compiler optimization level (0,1,2,3)
  * "unaligned_copy" -- Do not assume structures are 4B aligned
 
+Object cache:
+ * "no_object_cache" -- Do not use the on-disk cache of compiled CPU objects.
+ * "object_cache_dir" -- Set the location of the on-disk object cache.
+                         Default: $XDG_CACHE_HOME/psyneulink/llvm (~/.cache/psyneulink/llvm)
+ * "object_cache_size" -- Set the maximum size of the on-disk object cache in MiB.
+                          Least recently used objects are evicted first. Default: 256
+
 CUDA options:
  * "cuda_max_regs"  -- Set maximum allowed GPU arch registers.
                        Equivalent to the CUDA JIT compiler option of the same name.
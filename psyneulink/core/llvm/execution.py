@@ -14,6 +14,7 @@ from collections import Counter
 import concurrent.futures
 import copy
 import ctypes
+import itertools
 import numpy as np
 from inspect import isgenerator
 import os
@@ -41,6 +42,30 @@ def _convert_ctype_to_python(x):
     assert False, "Don't know how to convert: {}".format(x)
 
 
+def _convert_ctype_to_numpy(x, copy=False):
+    """Convert ctypes structure to nested lists of numpy arrays.
+
+    Arrays of builtin types are returned as numpy arrays that share
+    memory with *x* (unless *copy* is True), so no per-element
+    conversion is performed. Structures and arrays of structures
+    are converted to lists.
+    """
+    if isinstance(x, ctypes.Array):
+        dt = np.dtype(type(x))
+        base_dt = dt
+        while base_dt.subdtype is not None:
+            base_dt = base_dt.subdtype[0]
+        if base_dt.isbuiltin and dt.itemsize > 0:
+            arr = np.ctypeslib.as_array(x)
+            return arr.copy() if copy else arr
+    if isinstance(x, ctypes.Structure):
+        return [_convert_ctype_to_numpy(getattr(x, field_name), copy) for field_name, _ in x._fields_]
+    if isinstance(x, ctypes.Array):
+        return [_convert_ctype_to_numpy(el, copy) for el in x]
+
+    return _convert_ctype_to_python(x)
+
+
 def _tupleize(x):
     try:
         return tuple(_tupleize(y) for y in x)
@@ -78,6 +103,27 @@ def _pretty_size(size):
     return "{:.2f} {}".format(size, u)
 
 
+_thread_pool = None
+_thread_pool_size = 0
+
+
+def _get_thread_pool(jobs):
+    """Return a persistent thread pool with at least *jobs* workers.
+
+    The pool is shared by all executions to avoid paying thread
+    startup costs on every call.
+    """
+    global _thread_pool, _thread_pool_size
+    if _thread_pool is None or _thread_pool_size < jobs:
+        if _thread_pool is not None:
+            _thread_pool.shutdown(wait=False)
+        _thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=jobs,
+                                                             thread_name_prefix="pnl_llvm")
+        _thread_pool_size = jobs
+
+    return _thread_pool
+
+
 class Execution:
     def __init__(self):
         self._debug_env = debug_env
@@ -203,7 +249,7 @@ class CUDAExecution(Execution):
 
         # Copy the result from the device
         ct_res = self.download_ctype(self._cuda_out, type(self._ct_vo), 'result')
-        return _convert_ctype_to_python(ct_res)
+        return _convert_ctype_to_numpy(ct_res)
 
 
 class FuncExecution(CUDAExecution):
@@ -262,7 +308,8 @@ class FuncExecution(CUDAExecution):
                            ctypes.byref(self._state_struct),
                            ct_vi, ctypes.byref(self._ct_vo))
 
-        return _convert_ctype_to_python(self._ct_vo)
+        # The output buffer is reused across executions
+        return _convert_ctype_to_numpy(self._ct_vo, copy=True)
 
 
 class MechExecution(FuncExecution):
@@ -290,6 +337,8 @@ class CompExecution(CUDAExecution):
         self.__bin_func = None
         self.__bin_run_func = None
         self.__bin_run_multi_func = None
+        self.__bin_chunked_run_func = None
+        self.__bin_traced_run_func = None
         self.__frozen_vals = None
         self.__tags = frozenset(additional_tags)
 
@@ -326,6 +375,10 @@ class CompExecution(CUDAExecution):
             return self.__bin_exec_func
         if self.__bin_run_func is not None:
             return self.__bin_run_func
+        if self.__bin_chunked_run_func is not None:
+            return self.__bin_chunked_run_func
+        if self.__bin_traced_run_func is not None:
+            return self.__bin_traced_run_func
 
         assert False, "Binary function not set for execution!"
 
@@ -338,11 +391,13 @@ class CompExecution(CUDAExecution):
 
         return super()._bin_func_multirun
 
-    def _set_bin_node(self, node):
+    def _get_bin_node(self, node):
         assert node in self._composition._all_nodes
         wrapper = builder_context.LLVMBuilderContext.get_current().get_node_wrapper(self._composition, node)
-        self.__bin_func = pnlvm.LLVMBinaryFunction.from_obj(
-            wrapper, tags=self.__tags.union({"node_wrapper"}))
+        return pnlvm.LLVMBinaryFunction.from_obj(wrapper, tags=self.__tags.union({"node_wrapper"}))
+
+    def _set_bin_node(self, node):
+        self.__bin_func = self._get_bin_node(node)
 
     @property
     def _conditions(self):
@@ -374,7 +429,8 @@ class CompExecution(CUDAExecution):
     @property
     def _data_struct(self):
         # Run wrapper changed argument order
-        arg = 2 if self._bin_func is self.__bin_run_func else 3
+        arg = 2 if self._bin_func in (self.__bin_run_func, self.__bin_chunked_run_func,
+                                      self.__bin_traced_run_func) else 3
         return self._get_compilation_param('_data', '_get_data_initializer', arg)
 
     @_data_struct.setter
@@ -414,7 +470,7 @@ class CompExecution(CUDAExecution):
             elif attribute == 'matrix':
                 pnl_param = component.parameters.matrix
                 parameter_ctype = getattr(params, params._fields_[idx][0])
-                value = _convert_ctype_to_python(parameter_ctype)
+                value = _convert_ctype_to_numpy(parameter_ctype)
                 # Unflatten the matrix
                 # FIXME: this seems to break something when generalized for all attributes
                 value = np.array(value).reshape(pnl_param._get(context).shape)
@@ -435,7 +491,8 @@ class CompExecution(CUDAExecution):
         field_name = res_struct._fields_[index][0]
         res_struct = getattr(res_struct, field_name)
 
-        return _convert_ctype_to_python(res_struct)
+        # Data structures are updated in place by subsequent executions
+        return _convert_ctype_to_numpy(res_struct, copy=True)
 
     def extract_node_struct(self, node, struct):
         if len(self._execution_contexts) > 1:
@@ -519,6 +576,30 @@ class CompExecution(CUDAExecution):
 
         node._propagate_most_recent_context(context)
 
+    def execute_nodes(self, nodes, executor, context=None):
+        """Execute *nodes* concurrently using threads of *executor*.
+
+        The nodes must not depend on each other's output in the current
+        time step. Their functions are compiled before any of them is
+        executed, and all of them read the same frozen values.
+        """
+        assert len(self._execution_contexts) == 1
+        assert self._composition.input_CIM not in nodes
+        # Resolve the native functions here; doing so may JIT staged
+        # modules, which is not safe to do from multiple threads
+        bin_funcs = [self._get_bin_node(node).c_func for node in nodes]
+        if self.__frozen_vals is None:
+            self.freeze_values()
+
+        args = (self._state_struct, self._param_struct, None, self.__frozen_vals, self._data_struct)
+        futures = [executor.submit(f, *args) for f in bin_funcs]
+        concurrent.futures.wait(futures)
+        for f in futures:
+            f.result()
+
+        for node in nodes:
+            node._propagate_most_recent_context(context)
+
     @property
     def _bin_exec_func(self):
         if self.__bin_exec_func is None:
@@ -627,7 +708,7 @@ class CompExecution(CUDAExecution):
             self._bin_run_multi_func.wrap_call(self._state_struct, self._param_struct,
                                                self._data_struct, inputs, outputs,
                                                runs_count, input_count, self._ct_len)
-            return _convert_ctype_to_python(outputs)
+            return _convert_ctype_to_numpy(outputs)
         else:
             self._bin_run_func.wrap_call(self._state_struct, self._param_struct,
                                          self._data_struct, inputs, outputs,
@@ -635,7 +716,204 @@ class CompExecution(CUDAExecution):
 
             # Extract only #trials elements in case the run exited early
             assert runs_count.value <= runs, "Composition ran more times than allowed!"
-            return _convert_ctype_to_python(outputs)[0:runs_count.value]
+            return _convert_ctype_to_numpy(outputs)[0:runs_count.value]
+
+    @property
+    def _bin_chunked_run_func(self):
+        if self.__bin_chunked_run_func is None:
+            self.__bin_chunked_run_func = pnlvm.LLVMBinaryFunction.from_obj(
+                self._composition, tags=self.__tags.union({"run", "chunked"}))
+
+        return self.__bin_chunked_run_func
+
+    @property
+    def _bin_traced_run_func(self):
+        if self.__bin_traced_run_func is None:
+            self.__bin_traced_run_func = pnlvm.LLVMBinaryFunction.from_obj(
+                self._composition, tags=self.__tags.union({"run", "chunked", "trace"}))
+
+        return self.__bin_traced_run_func
+
+    def _log_trace(self, trace, first_trial, num_trials, context):
+        # Log the values recorded by a traced run, one entry for every
+        # trial in which a node executed. Parameter._log_values skips
+        # nodes whose value is not logged.
+        trace = np.ctypeslib.as_array(trace)[:num_trials]
+        values, times = (trace[name] for name in trace.dtype.names)
+        trials = np.arange(first_trial, first_trial + num_trials)
+        run = self._composition.scheduler.get_clock(context).time.run
+
+        for idx, node in enumerate(self._composition._get_trace_nodes()):
+            executed = times[:, idx, 0] == trials
+            node_values = values[values.dtype.names[idx]][executed]
+            if node_values.dtype.names is not None:
+                # values of ragged shape are recorded as structures
+                node_values = [[v[name] for name in v.dtype.names] for v in node_values]
+
+            node_times = np.empty((np.count_nonzero(executed), 4), dtype=np.int64)
+            node_times[:, 0] = run
+            node_times[:, 1:] = times[executed, idx]
+            node.parameters.value._log_values(node_values, node_times, context)
+
+    def log_node_values(self, context):
+        """Log the value of every traced node that executed in the last
+        trial run by `execute`.
+
+        Trials are numbered by the compiled scheduler, which keeps
+        counting them across runs.
+        """
+        conds = self._conditions
+        private = getattr(conds, conds._fields_[0][0])
+        global_ts, statuses = (_convert_ctype_to_numpy(getattr(private, name)) for name, _ in private._fields_)
+        run = self._composition.scheduler.get_clock(context).time.run
+
+        for node in self._composition._get_trace_nodes():
+            # The trial counter is bumped at the end of every execution
+            _, node_ts = statuses[self._composition.nodes.index(node)]
+            if node_ts[0] != global_ts[0] - 1:
+                continue
+
+            value = self.extract_node_state(node)[node.llvm_state_ids.index("value")][0]
+            node.parameters.value._log_values([value], [[run, *node_ts]], context)
+
+    def _get_chunk_input_struct(self, inputs, num_input_sets, start, count):
+        input_type = self._bin_chunked_run_func.byref_arg_types[3]
+        # Extract input for each trial of the chunk
+        chunk_inputs = (([x] for x in self._composition._build_variable_for_input_CIM({k:v[i % num_input_sets] for k,v in inputs.items()})) for i in range(start, start + count))
+        return (input_type * count)(*_tupleize(chunk_inputs))
+
+    def chunked_run(self, inputs, runs=0, num_input_sets=0, chunk_size=1000, log_context=None):
+        """Run the composition in chunks of at most *chunk_size* trials.
+
+        Yields a list of results for every chunk. Only input and output
+        buffers for one chunk are allocated at a time. Generator inputs
+        are consumed one chunk at a time.
+        Scheduler state is preserved between chunks,
+        so the results are the same as those returned by `run`.
+
+        If *log_context* is not None, the run also records the value of
+        every traced node at the end of each trial in a trace buffer,
+        which is ingested into the nodes' logs after every chunk.
+        """
+        assert len(self._execution_contexts) == 1
+        trace = log_context is not None
+        bin_f = self._bin_traced_run_func if trace else self._bin_chunked_run_func
+
+        input_type = bin_f.byref_arg_types[3]
+        output_type = bin_f.byref_arg_types[4]
+        conditions = bin_f.byref_arg_types[7](*helpers.ConditionGenerator(None, self._composition).get_condition_initializer())
+
+        if isgenerator(inputs):
+            assert num_input_sets == 0 or num_input_sets == sys.maxsize
+            runs = sys.maxsize if runs == 0 else runs
+        else:
+            runs = num_input_sets if runs == 0 or runs == sys.maxsize else runs
+
+        # Inputs consumed from a generator. These are reused cyclically
+        # if the generator is exhausted before the requested number of
+        # trials, matching the behaviour of `run`
+        consumed = []
+        exhausted = False
+
+        trial = 0
+        while trial < runs:
+            count = min(chunk_size, runs - trial)
+            if isgenerator(inputs):
+                if not exhausted:
+                    chunk_inputs = ((np.atleast_2d(x) for x in self._composition._build_variable_for_input_CIM({k:np.atleast_1d(v) for k,v in inp.items()})) for inp in itertools.islice(inputs, count))
+                    chunk_inputs = _tupleize(chunk_inputs)
+                    exhausted = len(chunk_inputs) < count
+                    if runs != sys.maxsize:
+                        consumed.extend(chunk_inputs)
+                    if exhausted and runs == sys.maxsize:
+                        count = len(chunk_inputs)
+                if exhausted and runs != sys.maxsize:
+                    if len(consumed) == 0:
+                        return
+                    chunk_inputs = [consumed[i % len(consumed)] for i in range(trial, trial + count)]
+                if count == 0:
+                    return
+                chunk_inputs = (input_type * count)(*chunk_inputs)
+            else:
+                chunk_inputs = self._get_chunk_input_struct(inputs, num_input_sets, trial, count)
+
+            outputs = (output_type * count)()
+            runs_count = ctypes.c_int(count)
+            trace_args = ((bin_f.byref_arg_types[8] * count)(),) if trace else ()
+            bin_f.wrap_call(self._state_struct, self._param_struct,
+                            self._data_struct, chunk_inputs, outputs,
+                            runs_count, ctypes.c_int(count), conditions,
+                            *trace_args)
+
+            assert runs_count.value <= count, "Composition ran more times than allowed!"
+            if runs_count.value > 0:
+                if trace:
+                    self._log_trace(*trace_args, trial, runs_count.value, log_context)
+                yield _convert_ctype_to_numpy(outputs)[0:runs_count.value]
+
+            trial += runs_count.value
+            # The run terminated early
+            if runs_count.value < count:
+                return
+
+    def thread_run(self, inputs, runs=0, num_input_sets=0, jobs=None):
+        """Run multiple execution contexts in parallel using a thread pool.
+
+        Contexts are split into contiguous chunks, each chunk is executed
+        by the multirun wrapper in a separate thread. Results are placed
+        in a shared output buffer, so the order of results matches the
+        order of execution contexts regardless of the order of completion.
+        """
+        if len(self._execution_contexts) == 1:
+            return self.run(inputs, runs, num_input_sets)
+
+        assert not isgenerator(inputs), "Generator inputs are not supported with multiple contexts!"
+        inputs = self._get_run_input_struct(inputs, num_input_sets)
+
+        ct_vo = self._bin_run_func.byref_arg_types[4] * runs
+        outputs = (ct_vo * len(self._execution_contexts))()
+
+        if "stat" in self._debug_env:
+            print("Input struct size:", _pretty_size(ctypes.sizeof(inputs)),
+                  "for", self._composition.name)
+            print("Output struct size:", _pretty_size(ctypes.sizeof(outputs)),
+                  "for", self._composition.name)
+
+        # Make sure the binary is compiled before starting the threads
+        bin_f = self._bin_run_multi_func
+        argtypes = bin_f.c_func.argtypes
+        shared_args = (self._state_struct, self._param_struct, self._data_struct,
+                       inputs, outputs)
+
+        num_contexts = len(self._execution_contexts)
+        jobs = min(jobs or os.cpu_count(), num_contexts)
+        contexts_per_job = (num_contexts + jobs - 1) // jobs
+
+        def _run_chunk(start, stop):
+            # Every chunk needs its own trial count,
+            # the compiled run updates it in place.
+            chunk_args = (ctypes.cast(ctypes.byref(a, start * ctypes.sizeof(a._type_)), t)
+                          for a, t in zip(shared_args, argtypes))
+            bin_f(*chunk_args, ctypes.byref(ctypes.c_int(runs)),
+                  ctypes.byref(ctypes.c_int(num_input_sets)),
+                  ctypes.byref(ctypes.c_int(stop - start)))
+
+        parallel_start = time.time()
+        ex = _get_thread_pool(jobs)
+        results = [ex.submit(_run_chunk, i, min(i + contexts_per_job, num_contexts))
+                   for i in range(0, num_contexts, contexts_per_job)]
+        concurrent.futures.wait(results)
+
+        parallel_stop = time.time()
+        if "time_stat" in self._debug_env:
+            print("Time to run {} contexts of '{}' in {} threads: {}".format(
+                      num_contexts, bin_f.name, jobs,
+                      parallel_stop - parallel_start))
+
+        exceptions = [r.exception() for r in results]
+        assert all(e is None for e in exceptions), "Not all jobs finished sucessfully: {}".format(exceptions)
+
+        return _convert_ctype_to_numpy(outputs)
 
     def cuda_run(self, inputs, runs, num_input_sets):
         # Create input buffer
@@ -673,11 +951,11 @@ class CompExecution(CUDAExecution):
         # Copy the data struct from the device
         ct_out = self.download_ctype(data_out, output_type, 'result')
         if len(self._execution_contexts) > 1:
-            return _convert_ctype_to_python(ct_out)
+            return _convert_ctype_to_numpy(ct_out)
         else:
             # Extract only #trials elements in case the run exited early
             assert runs_np[0] <= runs, "Composition ran more times than allowed!"
-            return _convert_ctype_to_python(ct_out)[0:runs_np[0]]
+            return _convert_ctype_to_numpy(ct_out)[0:runs_np[0]]
 
     def _prepare_evaluate(self, inputs, num_input_sets, num_evaluations):
         ocm = self._composition.controller
@@ -724,34 +1002,60 @@ class CompExecution(CUDAExecution):
 
         return ct_results
 
-    def thread_evaluate(self, inputs, num_input_sets, num_evaluations):
+    def thread_evaluate(self, inputs, num_input_sets, num_evaluations, *, jobs=None, chunk_size=None):
+        """Evaluate allocations using a persistent pool of threads.
+
+        Evaluations are distributed dynamically in chunks of *chunk_size*,
+        every thread picks the next available chunk once it finishes the
+        previous one. This balances the load if the cost of evaluations
+        varies, e.g. because of early terminating trials.
+        """
         ct_param, ct_state, ct_data, ct_inputs, out_ty = \
             self._prepare_evaluate(inputs, num_input_sets, num_evaluations)
 
         ct_results = out_ty()
-        jobs = min(os.cpu_count(), num_evaluations)
-        evals_per_job = (num_evaluations + jobs - 1) // jobs
+        jobs = min(jobs or os.cpu_count(), num_evaluations)
+        if chunk_size is None:
+            # Use several chunks per thread to allow rebalancing
+            chunk_size = max(1, num_evaluations // (jobs * 8))
+        num_chunks = (num_evaluations + chunk_size - 1) // chunk_size
+
+        bin_func = self.__bin_func
+        ct_inputs_arg = ctypes.cast(ctypes.byref(ct_inputs), bin_func.c_func.argtypes[5])
+
+        # 'next' on itertools.count is atomic, it's safe to share between threads
+        chunks = itertools.count()
+
+        def _evaluate_chunks():
+            evaluated_chunks = 0
+            for chunk in chunks:
+                if chunk >= num_chunks:
+                    break
+                # There are 7 arguments to evaluate_alloc_range:
+                # comp_param, comp_state, from, to, results, input, comp_data
+                bin_func(ct_param, ct_state,
+                         chunk * chunk_size,
+                         min((chunk + 1) * chunk_size, num_evaluations),
+                         ct_results, ct_inputs_arg, ct_data)
+                evaluated_chunks += 1
+            return evaluated_chunks
 
         parallel_start = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as ex:
-            # There are 7 arguments to evaluate_alloc_range:
-            # comp_param, comp_state, from, to, results, input, comp_data
-            results = [ex.submit(self.__bin_func, ct_param, ct_state,
-                                 int(i * evals_per_job),
-                                 min((i + 1) * evals_per_job, num_evaluations),
-                                 ct_results,
-                                 ctypes.cast(ctypes.byref(ct_inputs), self.__bin_func.c_func.argtypes[5]),
-                                 ct_data)
-                       for i in range(jobs)]
+        ex = _get_thread_pool(jobs)
+        results = [ex.submit(_evaluate_chunks) for _ in range(jobs)]
+        concurrent.futures.wait(results)
 
         parallel_stop = time.time()
         if "time_stat" in self._debug_env:
-            print("Time to run {} executions of '{}' in {} threads: {}".format(
-                      num_evaluations, self.__bin_func.name, jobs,
+            print("Time to run {} executions of '{}' in {} threads ({} chunks of {}): {}".format(
+                      num_evaluations, bin_func.name, jobs, num_chunks, chunk_size,
                       parallel_stop - parallel_start))
 
-
         exceptions = [r.exception() for r in results]
         assert all(e is None for e in exceptions), "Not all jobs finished sucessfully: {}".format(exceptions)
 
+        if "stat" in self._debug_env:
+            print("Chunks evaluated per thread for '{}': {}".format(
+                      bin_func.name, [r.result() for r in results]))
+
         return ct_results
@@ -566,6 +566,9 @@ class ConditionGenerator:
         ts_ptr = builder.gep(cond_ptr, [self._zero, self._zero, self._zero])
         return builder.load(ts_ptr)
 
+    def get_node_ts(self, builder, cond_ptr, node):
+        return self.__get_node_ts(builder, cond_ptr, node)
+
     def generate_update_after_run(self, builder, cond_ptr, node):
         status_ptr = self.__get_node_status_ptr(builder, cond_ptr, node)
         status = builder.load(status_ptr)
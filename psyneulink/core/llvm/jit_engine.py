@@ -9,6 +9,9 @@
 # ********************************************* LLVM bindings **************************************************************
 
 from llvmlite import binding
+import hashlib
+import os
+import tempfile
 import time
 import warnings
 
@@ -39,7 +42,7 @@ except Exception as e:
     ptx_enabled = False
 
 
-__all__ = ['cpu_jit_engine', 'ptx_enabled']
+__all__ = ['cpu_jit_engine', 'jit_object_cache', 'ptx_enabled']
 
 if ptx_enabled:
     __all__.append('ptx_jit_engine')
@@ -64,10 +67,14 @@ def _binding_initialize():
         __initialized = True
 
 
+def _get_opt_level():
+    return int(debug_env.get('opt', 2))
+
+
 def _cpu_jit_constructor():
     _binding_initialize()
 
-    opt_level = int(debug_env.get('opt', 2))
+    opt_level = _get_opt_level()
 
     # PassManagerBuilder can be shared
     __pass_manager_builder = binding.PassManagerBuilder()
@@ -103,7 +110,7 @@ def _cpu_jit_constructor():
 def _ptx_jit_constructor():
     _binding_initialize()
 
-    opt_level = int(debug_env.get('opt', 2))
+    opt_level = _get_opt_level()
 
     # PassManagerBuilder is used only for inlining simple functions
     __pass_manager_builder = binding.PassManagerBuilder()
@@ -148,6 +155,130 @@ def _try_parse_module(module):
     return mod
 
 
+class jit_object_cache:
+    """Content addressed on-disk cache of native objects produced by the CPU JIT engine.
+
+    Objects are stored in *cache_dir* under the hash of the optimized module IR,
+    the compilation target (triple, cpu name and features), optimization level,
+    and LLVM version. Entries are evicted in least-recently-used order
+    once the total size of the cache exceeds *max_size* bytes.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+
+        _binding_initialize()
+        target = "{};{};{};opt{};llvm{}".format(binding.get_process_triple(),
+                                                 binding.get_host_cpu_name(),
+                                                 binding.get_host_cpu_features().flatten(),
+                                                 _get_opt_level(),
+                                                 ".".join(str(v) for v in binding.llvm_version_info))
+        self._target_hash = hashlib.sha256(target.encode()).hexdigest()
+
+        # Code generation modifies the module, so the path
+        # needs to be remembered between 'getbuffer' and 'notify'
+        self._pending_paths = {}
+
+        # Track few statistics:
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @staticmethod
+    def from_debug_env():
+        """Create object cache based on the PNL_LLVM_DEBUG settings.
+
+        Returns None if the cache is disabled.
+        """
+        if "no_object_cache" in debug_env:
+            return None
+
+        cache_dir = debug_env.get("object_cache_dir")
+        if cache_dir is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+            cache_dir = os.path.join(cache_home, "psyneulink", "llvm")
+
+        max_size = int(debug_env.get("object_cache_size", 256)) * 1024 * 1024
+
+        return jit_object_cache(cache_dir, max_size)
+
+    def _entry_path(self, module):
+        h = hashlib.sha256(self._target_hash.encode())
+        h.update(str(module).encode())
+        return os.path.join(self._cache_dir, h.hexdigest() + ".o")
+
+    def _entries(self):
+        try:
+            with os.scandir(self._cache_dir) as it:
+                return [(e.stat().st_mtime, e.stat().st_size, e.path) for e in it
+                        if e.is_file() and e.name.endswith(".o")]
+        except OSError:
+            return []
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total_size = sum(e[1] for e in entries)
+        for _, size, path in entries:
+            if total_size <= self._max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Removed by a different process
+                pass
+            total_size -= size
+            self.evictions += 1
+
+    def getbuffer(self, module):
+        path = self._entry_path(module)
+        try:
+            with open(path, 'rb') as f:
+                buf = f.read()
+            # Update modification time to track LRU order
+            os.utime(path)
+        except OSError:
+            self._pending_paths[module] = path
+            self.misses += 1
+            if "compile" in debug_env:
+                print("OBJECT CACHE MISS: '{}'".format(module.name))
+            return None
+
+        self.hits += 1
+        if "compile" in debug_env:
+            print("OBJECT CACHE HIT: '{}' -> {}".format(module.name, path))
+        return buf
+
+    def notify(self, module, buf):
+        if len(buf) > self._max_size:
+            self._pending_paths.pop(module, None)
+            return
+
+        path = self._pending_paths.pop(module, None)
+        if path is None:
+            return
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # Write to a temporary file first and rename it,
+            # so that concurrent processes never see partial objects.
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(buf)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            warnings.warn("Failed to store compiled object in '{}': {}".format(self._cache_dir, e))
+            return
+
+        self.stores += 1
+        self._evict()
+
+    def print_stats(self):
+        print("Object cache '{}': hits: {}, misses: {}, stores: {}, evictions: {}".format(
+              self._cache_dir, self.hits, self.misses, self.stores, self.evictions))
+
+
 class jit_engine:
     def __init__(self):
         self._jit_engine = None
@@ -172,6 +303,8 @@ class jit_engine:
             print("Total optimized modules in '{}': {}".format(s, self.__optimized_modules))
             print("Total linked modules in '{}': {}".format(s, self.__linked_modules))
             print("Total parsed modules in '{}': {}".format(s, self.__parsed_modules))
+            if getattr(self, '_object_cache', None) is not None:
+                self._object_cache.print_stats()
 
     def opt_and_add_bin_module(self, module):
         start = time.perf_counter()
@@ -245,8 +378,11 @@ class jit_engine:
     def compile_staged(self):
         # Parse generated modules and link them
         mod_bundle = binding.parse_assembly("")
-        while self.staged_modules:
-            m = self.staged_modules.pop()
+        # Link modules in the order of their generation.
+        # This makes the linked IR, and thus object cache keys,
+        # independent of the iteration order of 'staged_modules'.
+        for m in sorted(self.staged_modules, key=lambda m: (len(m.name), m.name)):
+            self.staged_modules.remove(m)
 
             start = time.perf_counter()
             new_mod = _try_parse_module(m)
@@ -277,7 +413,8 @@ class cpu_jit_engine(jit_engine):
 
         self._jit_engine, self._jit_pass_manager, self._target_machine = _cpu_jit_constructor()
         if self._object_cache is not None:
-            self._jit_engine.set_object_cache(self._object_cache)
+            self._jit_engine.set_object_cache(self._object_cache.notify,
+                                              self._object_cache.getbuffer)
 
 
 _ptx_builtin_source = """
@@ -298,7 +435,7 @@ class ptx_jit_engine(jit_engine):
             # -dc option tells the compiler that the code will be used for linking
             self._generated_builtins = pycuda.compiler.compile(_ptx_builtin_source.format(type=str(LLVMBuilderContext.get_current().float_ty)), target='cubin', options=['-dc'])
 
-        def set_object_cache(cache):
+        def set_object_cache(self, notify_func=None, getbuffer_func=None):
             pass
 
         def add_module(self, module):
@@ -1,3 +1,6 @@
+from . import delivery
+from .delivery import *
 from .graph_pb2_grpc import ServeGraph
 
 __all__ = ['ServeGraph']
+__all__.extend(delivery.__all__)
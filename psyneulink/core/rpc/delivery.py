@@ -0,0 +1,299 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+#
+#
+# *************************************************  Delivery **********************************************************
+
+"""
+.. _Delivery_Overview:
+
+Overview
+--------
+Values for which a `delivery condition <Log_Delivery>` is satisfied are passed to the `rpc_pipeline
+<Context.rpc_pipeline>` of the `Context` in which they are computed.  Any object with a ``put`` method (e.g. a
+`Queue <queue.Queue>`) can serve as the pipeline, in which case an `Entry` message is built and put on it
+synchronously each time a value is delivered.  A `DeliveryPipeline` instead moves the construction of the messages
+off of the execution path:
+
+  * values are collected, unserialized, into a batch for each `TRIAL <TimeScale.TRIAL>`;
+
+  * completed batches are handed to a background thread through a bounded queue, and serialized there into `Entry`
+    messages (the data of which are encoded as packed repeated doubles);
+
+  * if the queue is full, execution either waits for the serializer (**overflow** = *BLOCK*), or the batch is
+    discarded and counted in `dropped <DeliveryPipeline.dropped>` (**overflow** = *DROP*).
+
+Messages are retrieved from a DeliveryPipeline using the same ``get`` and ``empty`` methods as a `Queue
+<queue.Queue>`, or by iterating over it, which yields messages until the pipeline is `closed <DeliveryPipeline.close>`.
+The batch for the most recent `TRIAL <TimeScale.TRIAL>` is not serialized until either the next one begins or `flush
+<DeliveryPipeline.flush>` is called.
+
+`CompositionServicer` implements the ``RunComposition`` call of the ``ServeGraph`` gRPC service, executing a
+`Composition` with a DeliveryPipeline and streaming the resulting `Entry` messages back to the client::
+
+    >>> import grpc                                                                 # doctest: +SKIP
+    >>> from concurrent import futures                                              # doctest: +SKIP
+    >>> server = grpc.server(futures.ThreadPoolExecutor())                          # doctest: +SKIP
+    >>> pnl.add_ServeGraphServicer_to_server(pnl.CompositionServicer(comp), server) # doctest: +SKIP
+
+.. _Delivery_Class_Reference:
+
+Class Reference
+---------------
+
+"""
+
+import itertools
+import queue
+import threading
+
+import grpc
+import numpy as np
+
+from psyneulink.core.globals.context import Context
+from psyneulink.core.globals.log import LogCondition
+from psyneulink.core.rpc.graph_pb2 import Entry, ndArray, serveCondition
+from psyneulink.core.rpc.graph_pb2_grpc import ServeGraphServicer, add_ServeGraphServicer_to_server
+
+__all__ = [
+    'BLOCK', 'CompositionServicer', 'DeliveryError', 'DeliveryPipeline', 'DROP', 'add_ServeGraphServicer_to_server',
+]
+
+BLOCK = 'block'
+DROP = 'drop'
+
+
+class DeliveryError(Exception):
+    pass
+
+
+def _encode_entry(component_name, parameter_name, time, execution_id, value):
+    if isinstance(value, Entry):
+        return value
+
+    value = np.asarray(value, dtype=float)
+    return Entry(
+        componentName=component_name,
+        parameterName=parameter_name,
+        time=f'{time.run}:{time.trial}:{time.pass_}:{time.time_step}',
+        context=execution_id,
+        value=ndArray(shape=value.shape, data=value.ravel().tolist())
+    )
+
+
+class DeliveryPipeline:
+    """
+    DeliveryPipeline(    \
+        maxsize=16,      \
+        overflow=BLOCK   \
+    )
+
+    Batches delivered values by `TRIAL <TimeScale.TRIAL>` and serializes them into `Entry` messages on a background
+    thread (see `Delivery_Overview`).
+
+    Arguments
+    ---------
+
+    maxsize : int : default 16
+        maximum number of batches waiting to be serialized.
+
+    overflow : BLOCK or DROP : default BLOCK
+        specifies what happens to a batch when **maxsize** batches are already waiting to be serialized:  *BLOCK*
+        waits for the serializer to catch up;  *DROP* discards the batch.
+
+    Attributes
+    ----------
+
+    overflow : BLOCK or DROP
+        determines what happens to a batch submitted when the queue of batches is full.
+
+    dropped : int
+        number of values that have been discarded under the *DROP* policy.
+
+    """
+    _poll_interval = 0.05
+
+    def __init__(self, maxsize=16, overflow=BLOCK):
+        if overflow not in {BLOCK, DROP}:
+            raise DeliveryError(f"overflow must be {BLOCK!r} or {DROP!r}, not {overflow!r}")
+
+        self.overflow = overflow
+        self.dropped = 0
+
+        self._batch = []
+        self._batch_trial = None
+        self._batch_lock = threading.Lock()
+        self._batches = queue.Queue(maxsize)
+        self._entries = queue.Queue()
+        self._closed = False
+        self._done = threading.Event()
+
+        self._serializer = threading.Thread(target=self._serialize, name='DeliveryPipeline', daemon=True)
+        self._serializer.start()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(overflow={self.overflow!r}, dropped={self.dropped})'
+
+    def _serialize(self):
+        try:
+            while True:
+                batch = self._batches.get()
+                try:
+                    if batch is None:
+                        return
+                    for item in batch:
+                        self._entries.put(_encode_entry(*item))
+                finally:
+                    self._batches.task_done()
+        finally:
+            self._done.set()
+
+    def _submit(self):
+        # must be called holding _batch_lock
+        if not self._batch:
+            return
+
+        batch = self._batch
+        self._batch = []
+        self._batch_trial = None
+
+        if self.overflow == BLOCK:
+            self._batches.put(batch)
+        else:
+            try:
+                self._batches.put_nowait(batch)
+            except queue.Full:
+                self.dropped += len(batch)
+
+    def deliver(self, component_name, parameter_name, time, execution_id, value):
+        """
+        Adds **value** to the batch for the `TRIAL <TimeScale.TRIAL>` in **time**, submitting the current batch for
+        serialization first if it belongs to a different one.
+        """
+        if self._closed:
+            raise DeliveryError(f'{self} is closed')
+
+        trial = (time.run, time.trial)
+        with self._batch_lock:
+            if trial != self._batch_trial:
+                self._submit()
+                self._batch_trial = trial
+            self._batch.append((component_name, parameter_name, time, execution_id, np.copy(value)))
+
+    def put(self, entry):
+        """
+        Adds an already constructed `Entry` to the current batch.
+        """
+        if self._closed:
+            raise DeliveryError(f'{self} is closed')
+
+        with self._batch_lock:
+            self._batch.append((None, None, None, None, entry))
+
+    def flush(self):
+        """
+        Submits the current batch and waits until all submitted batches have been serialized.
+        """
+        with self._batch_lock:
+            self._submit()
+        self._batches.join()
+
+    def close(self):
+        """
+        Flushes the pipeline and stops its serializer thread.  Entries already serialized can still be retrieved.
+        """
+        if self._closed:
+            return
+
+        self.flush()
+        self._closed = True
+        self._batches.put(None)
+        self._serializer.join()
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes and returns the next serialized `Entry`, as `Queue.get <queue.Queue.get>`.
+        """
+        return self._entries.get(block, timeout)
+
+    def empty(self):
+        """
+        Returns True if there are no serialized `Entries <Entry>` waiting to be retrieved.
+        """
+        return self._entries.empty()
+
+    def __iter__(self):
+        while True:
+            try:
+                yield self._entries.get(timeout=self._poll_interval)
+            except queue.Empty:
+                if self._done.is_set() and self._entries.empty():
+                    return
+
+
+class CompositionServicer(ServeGraphServicer):
+    """
+    CompositionServicer(   \
+        composition,       \
+        maxsize=16,        \
+        overflow=BLOCK     \
+    )
+
+    Implements the ``RunComposition`` call of the ``ServeGraph`` gRPC service for **composition**.  Each call runs
+    **composition** on the inputs it specifies, and streams the `Entry` messages for delivered values from a
+    `DeliveryPipeline`, constructed with **maxsize** and **overflow**, while the Composition executes.
+
+    The **inputs** of the request are keyed by the name of an `INPUT <NodeRole.INPUT>` Node, each row of the
+    corresponding matrix being the input to the Node for one `TRIAL <TimeScale.TRIAL>`.  Each entry of its
+    **servePrefs** sets the `delivery condition <Log_Delivery>` of a parameter of a Node or Projection in the
+    Composition.
+    """
+
+    def __init__(self, composition, maxsize=16, overflow=BLOCK):
+        self.composition = composition
+        self.maxsize = maxsize
+        self.overflow = overflow
+
+    def _get_component(self, name):
+        for component in itertools.chain(self.composition.nodes, self.composition.projections):
+            if component.name == name:
+                return component
+        raise DeliveryError(f'{self.composition.name} has no Node or Projection named {name!r}')
+
+    def _get_inputs(self, request):
+        inputs = {}
+        for name, matrix in request.inputs.items():
+            node = self._get_component(name)
+            inputs[node] = np.asarray(matrix.data, dtype=float).reshape(matrix.rows, matrix.cols)
+        return inputs
+
+    def RunComposition(self, request, context):
+        for pref in request.servePrefs.servePrefSet:
+            self._get_component(pref.componentName).set_delivery_conditions(
+                pref.parameterName, LogCondition[serveCondition.Name(pref.condition)]
+            )
+
+        inputs = self._get_inputs(request)
+        pipeline = DeliveryPipeline(maxsize=self.maxsize, overflow=self.overflow)
+        errors = []
+
+        def run():
+            try:
+                self.composition.run(
+                    inputs=inputs,
+                    context=Context(rpc_pipeline=pipeline, execution_id=self.composition.default_execution_id)
+                )
+            except Exception as e:
+                errors.append(e)
+            finally:
+                pipeline.close()
+
+        threading.Thread(target=run, name=f'{self.composition.name} RunComposition', daemon=True).start()
+        yield from pipeline
+
+        if errors:
+            context.abort(grpc.StatusCode.INTERNAL, str(errors[0]))
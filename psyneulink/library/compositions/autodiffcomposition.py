@@ -184,6 +184,19 @@ maps <https://github.com/giannisnik/som>`_).
        executing using the *Python* interpreter (and not PyTorch);  this is so that any modulation can take effect
        during execution (see `AutodiffComposition_Nested_Modulation` below), which is not supported by PyTorch.
 
+.. _AutodiffComposition_Batched_Training:
+
+By default, each trial of a minibatch is executed by a separate forward computation of the PyTorch model, and only
+the update of the weights is deferred to the end of the minibatch.  If **batched_training** is True in the
+constructor, the inputs and targets for all of the trials in a minibatch are instead stacked into tensors with one row
+per trial, and the entire minibatch is executed with a single forward and backward computation, which replaces the
+per-trial overhead with matrix-matrix products.  The outputs of each trial remain available in the `results
+<Composition.results>` of the AutodiffComposition, and the loss is the same as it is for trials executed one at a time.
+This applies to the `learn <Composition.learn>` method when its **inputs** are specified as a dict;  minibatches are
+still executed one trial at a time if **inputs** is a function, if **loss_spec** is not one of the elementwise
+losses (*MSE*, *SSE*, *L1*, *POISSON_NLL* or *KL_DIV*), or if any Mechanism uses the `SoftMax` function.  Values
+that are `logged <AutodiffComposition_Logging>` during a minibatch executed in this way are those of its last trial.
+
 .. technical_note::
    `ExecutionMode.PyTorch` is a synonym for `ExecutionMode.Python`, that is provided for clarity of the user interface:
    the default for an AutodiffComposition (i.e., if **execution_mode** is not specified, or it is set to
@@ -359,6 +372,10 @@ class AutodiffComposition(Composition):
     loss_spec : Loss or PyTorch loss function : default Loss.MSE
         specifies the loss function for training; see `Loss` for arguments.
 
+    batched_training : bool : default False
+        specifies whether, in `PyTorch mode <AutodiffComposition_PyTorch>`, the trials of each minibatch are
+        executed together (see `AutodiffComposition_Batched_Training`).
+
     Attributes
     ----------
 
@@ -372,6 +389,10 @@ class AutodiffComposition(Composition):
     loss : PyTorch loss function
         the loss function used for training. Depends on the **loss_spec** argument from initialization.
 
+    batched_training : bool
+        determines whether the trials of each minibatch are executed together in `PyTorch mode
+        <AutodiffComposition_PyTorch>` (see `AutodiffComposition_Batched_Training`).
+
     """
 
     componentCategory = AUTODIFF_COMPOSITION
@@ -382,6 +403,7 @@ class AutodiffComposition(Composition):
         trial_losses = Parameter([])
         tracked_loss = Parameter(None, pnl_internal=True)
         tracked_loss_count = Parameter(0, pnl_internal=True)
+        minibatch_outputs = Parameter(None, pnl_internal=True)
         pytorch_representation = None
 
     # TODO (CW 9/28/18): add compositions to registry so default arg for name is no longer needed
@@ -397,6 +419,7 @@ class AutodiffComposition(Composition):
                  disable_cuda=True,
                  cuda_index=None,
                  force_no_retain_graph=False,
+                 batched_training=False,
                  name="autodiff_composition"):
 
         if not torch_available:
@@ -416,6 +439,7 @@ class AutodiffComposition(Composition):
         self._built_pathways = False
         self.weight_decay = weight_decay
         self.force_no_retain_graph = force_no_retain_graph
+        self.batched_training = batched_training
         self.loss = None
         self.disable_learning = disable_learning
         self._runtime_learning_rate = None
@@ -510,10 +534,7 @@ class AutodiffComposition(Composition):
                                            f"likelihood), POISSONNLL (Poisson negative log likelihood, "
                                            f"and KL_DIV (KL divergence.")
 
-    # performs learning/training on all input-target pairs it recieves for given number of epochs
-    def autodiff_training(self, inputs, targets, context=None, scheduler=None):
-
-        # compute total loss across output neurons for current trial
+    def _get_tracked_loss(self, context):
         tracked_loss = self.parameters.tracked_loss._get(context)
         if tracked_loss is None:
             self.parameters.tracked_loss._set(torch.zeros(1, device=self.device).double(),
@@ -521,6 +542,76 @@ class AutodiffComposition(Composition):
                                               skip_history=True,
                                               skip_log=True)
             tracked_loss = self.parameters.tracked_loss._get(context)
+        return tracked_loss
+
+    def _get_output_nodes(self):
+        output_nodes = []
+        for input_port in self.output_CIM.input_ports:
+            assert (len(input_port.all_afferents) == 1)  # CW 12/05/18, this assert may eventually be outdated
+            output_nodes.append(input_port.all_afferents[0].sender.owner)
+        return output_nodes
+
+    def _get_minibatch_loss_scale(self, minibatch_size):
+        """
+        Returns the factor by which the loss of a minibatch must be multiplied to equal the sum of the losses of its
+        trials, or None if the loss cannot be computed for a whole minibatch at once
+        """
+        if self.loss_spec == Loss.MSE:
+            return minibatch_size
+        if self.loss_spec in {Loss.SSE, Loss.L1, Loss.POISSON_NLL, Loss.KL_DIV}:
+            return 1
+        return None
+
+    def _execute_minibatch(self, minibatch, context):
+        """
+        Executes the trials in **minibatch** (a list of input dicts, one per trial) with a single forward computation
+        of the PyTorch model, adds their loss to tracked_loss, and stores their outputs to be returned by
+        autodiff_training when the trials are executed.  Does nothing if the minibatch cannot be executed at once, in
+        which case its trials are trained one at a time (see `AutodiffComposition_Batched_Training`).
+        """
+        pytorch_representation = self._build_pytorch_representation(context)
+        loss_scale = self._get_minibatch_loss_scale(len(minibatch))
+        if loss_scale is None or not pytorch_representation.batchable:
+            return
+
+        def stack(trial_values, nodes):
+            return {node: torch.tensor(np.array([values[node][0] for values in trial_values], dtype=float),
+                                       device=self.device).double()
+                    for node in nodes}
+
+        input_nodes = self._infer_input_nodes(minibatch[0])
+        trial_targets = [self._infer_output_nodes(trial) for trial in minibatch]
+        curr_tensor_inputs = stack(minibatch, input_nodes)
+        curr_tensor_targets = stack(trial_targets, trial_targets[0])
+
+        curr_tensor_outputs = pytorch_representation.forward(curr_tensor_inputs, context)
+
+        tracked_loss = self._get_tracked_loss(context)
+        for component in curr_tensor_outputs.keys():
+            tracked_loss += self.loss(curr_tensor_outputs[component], curr_tensor_targets[component]) * loss_scale
+
+        outputs = [curr_tensor_outputs[component].detach().cpu().numpy() for component in self._get_output_nodes()]
+        self.parameters.minibatch_outputs._set([[output[i].copy() for output in outputs]
+                                                for i in range(len(minibatch))],
+                                               context=context,
+                                               skip_history=True,
+                                               skip_log=True)
+        self.parameters.tracked_loss_count._set(self.parameters.tracked_loss_count._get(context=context)
+                                                + len(minibatch),
+                                                context=context,
+                                                skip_history=True,
+                                                skip_log=True)
+
+    # performs learning/training on all input-target pairs it recieves for given number of epochs
+    def autodiff_training(self, inputs, targets, context=None, scheduler=None):
+
+        # outputs of a trial already computed as part of its minibatch
+        minibatch_outputs = self.parameters.minibatch_outputs._get(context)
+        if minibatch_outputs:
+            return minibatch_outputs.pop(0)
+
+        # compute total loss across output neurons for current trial
+        tracked_loss = self._get_tracked_loss(context)
 
         curr_tensor_inputs = {}
         curr_tensor_targets = {}
@@ -543,9 +634,7 @@ class AutodiffComposition(Composition):
             tracked_loss += new_loss
 
         outputs = []
-        for input_port in self.output_CIM.input_ports:
-            assert (len(input_port.all_afferents) == 1)  # CW 12/05/18, this assert may eventually be outdated
-            component = input_port.all_afferents[0].sender.owner
+        for component in self._get_output_nodes():
             outputs.append(curr_tensor_outputs[component].detach().cpu().numpy().copy())
 
         self.parameters.tracked_loss_count._set(self.parameters.tracked_loss_count._get(context=context) + 1,
@@ -58,6 +58,11 @@ class CompositionRunner():
         assert call_before_minibatch is None or not self._is_llvm_mode, "minibatch calls don't work in compiled mode"
         assert call_after_minibatch is None or not self._is_llvm_mode, "minibatch calls don't work in compiled mode"
 
+        from psyneulink.library.compositions import AutodiffComposition
+        batched = (not self._is_llvm_mode
+                   and isinstance(self._composition, AutodiffComposition)
+                   and self._composition.batched_training)
+
         #This is a generator for performance reasons,
         #    since we don't want to copy any data (especially for very large inputs or epoch counts!)
         for epoch in range(epochs):
@@ -68,11 +73,12 @@ class CompositionRunner():
                 if call_before_minibatch:
                     call_before_minibatch()
                 curr_indices = indices[i:i + batch_size]
-                for idx in curr_indices:
-                    chunk = {}
-                    for k, v in inputs.items():
-                        chunk[k] = v[idx % len(v)]
-                    yield chunk
+                minibatch = [{k: v[idx % len(v)] for k, v in inputs.items()} for idx in curr_indices]
+                # Run the forward pass for the whole minibatch at once;
+                # the trials below then only report their share of its outputs
+                if batched:
+                    self._composition._execute_minibatch(minibatch, context)
+                yield from minibatch
                 if call_after_minibatch:
                     call_after_minibatch()
 
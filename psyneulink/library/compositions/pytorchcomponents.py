@@ -63,6 +63,13 @@ class PytorchMechanismWrapper():
 
         self._target_mechanism = None
 
+    @property
+    def batchable(self):
+        """
+        Whether the function can be executed on a minibatch of variables stacked along the first dimension
+        """
+        return not isinstance(self._mechanism.function, SoftMax)
+
     def add_efferent(self, efferent):
         assert efferent not in self.efferents
         self.efferents.append(efferent)
@@ -109,7 +116,9 @@ class PytorchMechanismWrapper():
 
     def log_value(self):
         if self._mechanism.parameters.value.log_condition != LogCondition.OFF:
-            detached_value = self.value.detach().cpu().numpy()
+            # a minibatch executed at once is logged as its last trial
+            value = self.value[-1] if self.value.dim() > 1 else self.value
+            detached_value = value.detach().cpu().numpy()
             self._mechanism.output_port.parameters.value._set(detached_value, self._context)
             self._mechanism.parameters.value._set(detached_value, self._context)
 
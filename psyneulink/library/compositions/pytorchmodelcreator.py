@@ -305,7 +305,12 @@ class PytorchModelCreator(torch.nn.Module):
             raise Exception("OPTIMIZER TYPE", optimizer_type, "NOT SUPPORTED")
         return optimizer
 
+    @property
+    def batchable(self):
+        return all(node.batchable for node in self.nodes)
+
     # performs forward computation for the model
+    # inputs may be either single trial vectors or minibatches of them, stacked along the first dimension
     @handle_external_context()
     def forward(self, inputs, context=None):
         outputs = {}  # dict for storing values of terminal (output) nodes
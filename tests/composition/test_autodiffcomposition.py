@@ -3175,6 +3175,35 @@ class TestBatching:
         assert np.allclose(c1_results[0][:2], c2_results[0][:2])
         assert np.allclose(c1_results[0][2:], c2_results[0][2:])
 
+    @pytest.mark.parametrize("loss_spec", [Loss.MSE, Loss.SSE])
+    @pytest.mark.parametrize("minibatch_size", [1, 3, TRAINING_SET])
+    def test_batched_training(self, loss_spec, minibatch_size):
+        np.random.seed(0)
+        hid_matrix = np.random.rand(2, 10)
+        out_matrix = np.random.rand(10, 1)
+
+        xor_inputs = np.array([[0, 0], [0, 1], [1, 0], [1, 1], [0.5, 0.5], [0.2, 0.8]])
+        xor_targets = np.array([[0], [1], [1], [0], [0.5], [0.5]])
+
+        def train(batched_training):
+            xor_in = TransferMechanism(name='xor_in', default_variable=np.zeros(2))
+            xor_hid = TransferMechanism(name='xor_hid', default_variable=np.zeros(10), function=Logistic())
+            xor_out = TransferMechanism(name='xor_out', default_variable=np.zeros(1), function=Logistic())
+            hid_map = MappingProjection(matrix=hid_matrix.copy())
+            out_map = MappingProjection(matrix=out_matrix.copy())
+            xor = AutodiffComposition(learning_rate=10, loss_spec=loss_spec, batched_training=batched_training)
+            xor.add_linear_processing_pathway([xor_in, hid_map, xor_hid, out_map, xor_out])
+
+            xor.learn(inputs={"inputs": {xor_in: xor_inputs},
+                              "targets": {xor_out: xor_targets},
+                              "epochs": 5},
+                      minibatch_size=minibatch_size,
+                      randomize_minibatches=False)
+            return xor.results, xor.parameters.losses.get(xor), hid_map.parameters.matrix.get(xor)
+
+        for expected, batched in zip(train(False), train(True)):
+            np.testing.assert_allclose(batched, expected)
+
     def test_cross_entropy_loss(self):
         import torch
 
@@ -7,6 +7,7 @@ import numpy as np
 import pytest
 
 import psyneulink as pnl
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.nonstateful.combinationfunctions import LinearCombination
 from psyneulink.core.components.functions.nonstateful.learningfunctions import \
     LearningFunction, Reinforcement, BackPropagation, TDLearning
@@ -3307,6 +3308,54 @@ class TestRunInputSpecifications:
         c.run(inputs=t_g, num_trials=1, execution_mode=mode)
         assert c.parameters.results.get(c) == [[np.array([0.])]]
 
+    @pytest.mark.llvm
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+    @pytest.mark.parametrize("generator", [True, False])
+    def test_chunked_run(self, chunk_size, generator):
+        A = pnl.TransferMechanism(size=2, function=pnl.Logistic, integrator_mode=True)
+        B = pnl.TransferMechanism(size=2)
+        c = pnl.Composition(pathways=[A, B])
+        # Run termination depends on scheduler state preserved between chunks
+        c.termination_processing = {pnl.TimeScale.RUN: pnl.AtTrial(5)}
+
+        def test_generator():
+            for i in range(7):
+                yield {A: [[i, i + 1]]}
+
+        inputs = test_generator() if generator else {A: [[i, i + 1] for i in range(7)]}
+        c.run(inputs=test_generator(), execution_mode=pnl.ExecutionMode.Python)
+        expected = c.parameters.results.get(c)
+
+        context = pnl.Context(execution_id="chunked")
+        c.run(inputs={A: [[0, 0]]}, num_trials=0, context=context)
+        inputs, num_inputs_sets = c._parse_run_inputs(inputs, context)
+        e = pnlvm.CompExecution(c, [context.execution_id])
+        chunks = list(e.chunked_run(inputs, 0 if generator else 7, num_inputs_sets, chunk_size=chunk_size))
+
+        assert len(chunks) == (5 + chunk_size - 1) // chunk_size
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        np.testing.assert_allclose([res for chunk in chunks for res in chunk], expected)
+
+    @pytest.mark.llvm
+    @pytest.mark.parametrize("chunk_size", [1, 2, 100])
+    def test_chunked_run_generator_reuses_inputs(self, chunk_size):
+        A = pnl.TransferMechanism(size=2, function=pnl.Logistic, integrator_mode=True)
+        c = pnl.Composition(pathways=[A])
+
+        def test_generator():
+            for i in range(3):
+                yield {A: [[i, i + 1]]}
+
+        # The generator is exhausted after 3 trials, its inputs are reused for the rest
+        for execution_id in ("run", "chunked"):
+            c.run(inputs={A: [[0, 0]]}, num_trials=0, context=pnl.Context(execution_id=execution_id))
+        expected = pnlvm.CompExecution(c, ["run"]).run(test_generator(), 7)
+        e = pnlvm.CompExecution(c, ["chunked"])
+        chunks = list(e.chunked_run(test_generator(), 7, chunk_size=chunk_size))
+
+        assert sum(len(chunk) for chunk in chunks) == 7
+        np.testing.assert_allclose([res for chunk in chunks for res in chunk], expected)
+
     def test_error_on_malformed_generator(self):
         c = pnl.Composition()
 
@@ -3358,6 +3407,36 @@ class TestRun:
         output = comp.run(inputs=inputs_dict, scheduler=sched, execution_mode=comp_mode)
         assert np.allclose(output, [[225, 225, 225]])
 
+    @pytest.mark.composition
+    @pytest.mark.parametrize("threads", [1, 2, 4])
+    def test_run_execution_set_threads(self, comp_mode, threads):
+        np.random.seed(0)
+        matrices = np.random.rand(8, 3, 3)
+
+        def build(execution_set_threads):
+            A = TransferMechanism(size=3, name='A')
+            O = TransferMechanism(size=3, name='O')
+            comp = Composition(execution_set_threads=execution_set_threads)
+            for i in range(4):
+                H = TransferMechanism(size=3, function=pnl.Logistic, integrator_mode=True, name=f'H{i}')
+                comp.add_linear_processing_pathway([A, MappingProjection(matrix=matrices[2 * i]),
+                                                    H, MappingProjection(matrix=matrices[2 * i + 1]), O])
+            return comp, A
+
+        inputs = np.random.rand(5, 3)
+        comp, A = build(None)
+        expected = comp.run(inputs={A: inputs}, execution_mode=comp_mode)
+
+        comp, A = build(threads)
+        output = comp.run(inputs={A: inputs}, execution_mode=comp_mode)
+        np.testing.assert_array_equal(output, expected)
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("threads", [0, -2, 1.5, 'all'])
+    def test_run_execution_set_threads_invalid(self, threads):
+        with pytest.raises(pnl.ParameterError, match='must be None or a positive integer'):
+            Composition(execution_set_threads=threads)
+
     @pytest.mark.projection
     @pytest.mark.composition
     def test_run_2_mechanisms_input_shrink(self, comp_mode):
@@ -2662,6 +2662,32 @@ class TestModelBasedOptimizationControlMechanisms_Execution:
         assert type(comp.controller.function) == pnl.GridSearch
         assert comp.run([1], execution_mode=mode) == [[10]]
 
+    @pytest.mark.llvm
+    @pytest.mark.parametrize("threads", [None, 1, 3])
+    @pytest.mark.parametrize("chunk_size", [None, 1, 4, 100])
+    def test_ocm_thread_evaluate_chunks(self, threads, chunk_size):
+        a = pnl.ProcessingMechanism()
+        comp = pnl.Composition(
+            controller_mode=pnl.BEFORE,
+            nodes=[a],
+            controller=pnl.OptimizationControlMechanism(
+                control=pnl.ControlSignal(
+                    modulates=(pnl.SLOPE, a),
+                    cost_options=None
+                ),
+                state_features=[a.input_port],
+                objective_mechanism=pnl.ObjectiveMechanism(
+                    monitor=[a.output_port]
+                ),
+                search_space=SampleIterator([1, 3, 10, 2, 5, 7, 4, 6, 8, 9])
+            )
+        )
+        comp.controller.comp_execution_mode = 'LLVM'
+        comp.controller.comp_execution_threads = threads
+        comp.controller.comp_execution_chunk_size = chunk_size
+
+        assert comp.run([1]) == [[10]]
+
     def test_evc(self):
         # Mechanisms
         Input = pnl.TransferMechanism(name='Input')
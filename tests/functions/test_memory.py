@@ -586,6 +586,59 @@ class TestDictionaryMemory:
                            [[12,22,32],[42,52,62]]]
         assert np.allclose(em.memory, expected_memory)
 
+    def test_DictionaryMemory_max_entries_circular_storage(self):
+
+        em = DictionaryMemory(
+                initializer=[[[1,1,1], [0,1,2]]],
+                duplicate_keys=True,
+                equidistant_keys_select=OLDEST,
+                max_entries = 3,
+                seed=module_seed,
+        )
+        states = []
+        for i in range(1, 10):
+            em.add_to_memory([[1,1,1], [i,i+1,i+2]])
+            states.append(em.parameters.previous_value.get())
+
+        # Earlier states of memory are unaffected by later stores and evictions
+        for i, state in enumerate(states, start=1):
+            expected_vals = [[j,j+1,j+2] for j in range(max(0, i-2), i+1)]
+            assert np.allclose(state[Functions.KEYS], [[1,1,1]] * len(expected_vals))
+            assert np.allclose(state[Functions.VALS], expected_vals)
+
+        # All keys are the same, so the oldest is retrieved
+        assert np.allclose(em.get_memory([1,1,1]), [[1,1,1], [7,8,9]])
+
+    def test_DictionaryMemory_approximate_retrieval(self):
+        rng = np.random.default_rng(module_seed)
+        keys = rng.random((300, 8)) - 0.5
+        vals = rng.random((300, 8))
+
+        em = DictionaryMemory(
+                initializer=[[k, v] for k, v in zip(keys[:250], vals[:250])],
+                duplicate_keys=True,
+                max_entries=280,
+                approximate_retrieval=True,
+                seed=module_seed,
+        )
+        for i in [0, 100, 249]:
+            retrieved = em.get_memory(keys[i] + 0.001)
+            assert np.allclose(retrieved, [keys[i], vals[i]])
+
+        # Index is updated as memories are added, evicted and deleted
+        index = em.parameters.retrieval_index.get()
+        em.add_to_memory([[k, v] for k, v in zip(keys[250:], vals[250:])])
+        em.delete_from_memory([[keys[299], vals[299]]])
+        assert em.parameters.retrieval_index.get() is index
+        assert len(index._ids) == len(em.memory) == 279
+
+        for i in [50, 249, 298]:
+            retrieved = em.get_memory(keys[i] + 0.001)
+            assert np.allclose(retrieved, [keys[i], vals[i]])
+        for i in [0, 299]:
+            retrieved = em.get_memory(keys[i] + 0.001)
+            assert not np.allclose(retrieved[0], keys[i])
+
     @pytest.mark.parametrize(
         'param_name',
         [
@@ -1182,6 +1235,93 @@ class TestContentAddressableMemory:
                            [[12,22,32],[42,52,62]]]
         assert np.allclose(c.memory, expected_memory)
 
+    @pytest.mark.parametrize('equidistant_entries_select, expected_index', [(OLDEST, 0), (NEWEST, -1)])
+    def test_ContentAddressableMemory_max_entries_circular_storage(self, equidistant_entries_select, expected_index):
+
+        c = ContentAddressableMemory(
+                initializer=[[[0,0], [0,0]]],
+                duplicate_entries_allowed=True,
+                equidistant_entries_select=equidistant_entries_select,
+                max_entries = 3,
+                seed=module_seed,
+        )
+        states = []
+        for i in range(1, 10):
+            c.add_to_memory([[i,i], [i,i]])
+            states.append(c.parameters.previous_value.get())
+
+        # Earlier states of memory are unaffected by later stores and evictions
+        for i, state in enumerate(states, start=1):
+            expected_memory = [[[j,j], [j,j]] for j in range(max(0, i-2), i+1)]
+            assert np.allclose(state, expected_memory)
+
+        # Entries are equidistant from the cue, so the oldest or newest is retrieved
+        retrieved = c.get_memory([[5,5], [5,5]])
+        assert np.allclose(retrieved, c.memory[expected_index])
+
+    @pytest.mark.parametrize('metric', [COSINE, EUCLIDEAN])
+    def test_ContentAddressableMemory_approximate_retrieval(self, metric):
+        rng = np.random.default_rng(module_seed)
+        entries = rng.random((600, 2, 8)) - 0.5
+
+        c = ContentAddressableMemory(
+            initializer=entries[:500],
+            distance_function=Distance(metric=metric),
+            duplicate_entries_allowed=True,
+            max_entries=550,
+            approximate_retrieval=True,
+            seed=module_seed,
+        )
+        for i in [0, 250, 499]:
+            assert np.allclose(c.get_memory(entries[i] + 0.001), entries[i])
+        # Only candidates from the index are compared with the cue
+        assert len(c.distances_to_entries) < 500
+
+        # Index is updated as entries are added, evicted and deleted
+        index = c.parameters.retrieval_index.get()
+        c.add_to_memory(entries[500:])
+        c.delete_from_memory([entries[300]])
+        assert c.parameters.retrieval_index.get() is index
+        assert len(index._ids) == len(c.memory) == 549
+
+        for i in [50, 499, 599]:
+            assert np.allclose(c.get_memory(entries[i] + 0.001), entries[i])
+        for i in [0, 300]:
+            assert not np.allclose(c.get_memory(entries[i] + 0.001), entries[i])
+
+        # Index is not used if the selection function does not select the nearest entry
+        c.selection_function = OneHot(mode=MAX_INDICATOR)
+        c.parameters.retrieval_index.set(None, override=True)
+        c.get_memory(entries[50])
+        assert c.parameters.retrieval_index.get() is None
+        assert len(c.distances_to_entries) == 549
+
+    @pytest.mark.parametrize('metric', [EUCLIDEAN, COSINE, DIFFERENCE, CORRELATION, MAX_ABS_DIFF, ENERGY])
+    @pytest.mark.parametrize('field_weights', [[1, 1], [2.5], [1, 2], [0, 1]])
+    def test_ContentAddressableMemory_vectorized_distances(self, metric, field_weights):
+        rng = np.random.default_rng(module_seed)
+        entries = rng.random((50, 2, 5))
+        cues = rng.random((4, 2, 5))
+
+        c = ContentAddressableMemory(
+            initializer=entries,
+            distance_function=Distance(metric=metric),
+            distance_field_weights=field_weights,
+            storage_prob=0,
+            seed=module_seed,
+        )
+
+        memory = c.parameters.previous_value.get()
+        distances = c._get_distances_to_entries(list(cues), memory, field_weights, None)
+        expected = [[c._get_distance(cue, entry, field_weights, 'full_entry', None) for entry in memory]
+                    for cue in cues]
+        np.testing.assert_allclose(distances, expected)
+
+        retrieved = c.get_memories(cues)
+        for cue, entry in zip(cues, retrieved):
+            np.testing.assert_array_equal(entry, c.get_memory(cue))
+        np.testing.assert_allclose(c.distances_to_entries, expected[-1])
+
     def test_ContentAddressableMemory_errors_and_warnings(self):
 
         # Test constructor warnings and errors
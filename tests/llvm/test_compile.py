@@ -2,6 +2,8 @@ import ctypes
 import numpy as np
 import pytest
 
+from llvmlite import ir
+
 from psyneulink.core import llvm as pnlvm
 
 ITERATIONS=100
@@ -53,3 +55,68 @@ def test_recompile():
 
     binf2(ct_vec, ct_mat, x, y, ct_res)
     assert np.array_equal(new_res, callable_res)
+
+@pytest.mark.llvm
+def test_object_cache(tmp_path):
+    def _compile_add(engine):
+        module = ir.Module(name="test_object_cache")
+        double_ty = ir.DoubleType()
+        func = ir.Function(module, ir.FunctionType(double_ty, [double_ty, double_ty]), name="test_object_cache_add")
+        builder = ir.IRBuilder(func.append_basic_block(name="entry"))
+        builder.ret(builder.fadd(*func.args))
+
+        engine.stage_compilation({module})
+        engine.compile_staged()
+        ptr = engine._engine.get_function_address(func.name)
+        return ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double, ctypes.c_double)(ptr)
+
+    cache = pnlvm.jit_object_cache(str(tmp_path), 1024 * 1024 * 1024)
+
+    engine = pnlvm.cpu_jit_engine(cache)
+    assert _compile_add(engine)(1.0, 2.0) == 3.0
+    assert cache.hits == 0
+    assert cache.misses > 0
+    assert cache.stores == cache.misses
+    assert len(list(tmp_path.iterdir())) == cache.stores
+
+    # A new engine should load the same objects from the cache
+    misses = cache.misses
+    engine2 = pnlvm.cpu_jit_engine(cache)
+    assert _compile_add(engine2)(2.0, 3.0) == 5.0
+    assert cache.hits == misses
+    assert cache.misses == misses
+
+    # Shrinking the cache evicts all entries that don't fit
+    small_cache = pnlvm.jit_object_cache(str(tmp_path), 0)
+    small_cache._evict()
+    assert small_cache.evictions == cache.stores
+    assert len(list(tmp_path.iterdir())) == 0
+
+
+@pytest.mark.llvm
+def test_convert_ctype_to_numpy():
+    class Node(ctypes.Structure):
+        _fields_ = [("vec", ctypes.c_double * 3),
+                    ("mat", (ctypes.c_double * 2) * 2),
+                    ("scalar", ctypes.c_double),
+                    ("empty", ctypes.c_double * 0)]
+
+    data = (Node * 2)()
+    data[1].vec[2] = 5.0
+    data[1].mat[0][1] = 3.0
+    data[1].scalar = 2.0
+
+    res = pnlvm.execution._convert_ctype_to_numpy(data)
+    assert res[1][0].shape == (3,)
+    assert res[1][1].shape == (2, 2)
+    assert res[1][2] == 2.0
+    assert res[1][3] == []
+    np.testing.assert_array_equal(res[1][0], [0.0, 0.0, 5.0])
+    np.testing.assert_array_equal(res[1][1], [[0.0, 3.0], [0.0, 0.0]])
+    assert pnlvm.execution._convert_ctype_to_python(data) == [[r.tolist() if isinstance(r, np.ndarray) else r for r in node] for node in res]
+
+    # Views share memory with the ctypes buffer, copies do not
+    copied = pnlvm.execution._convert_ctype_to_numpy(data, copy=True)
+    res[1][1][1][1] = 7.0
+    assert data[1].mat[1][1] == 7.0
+    assert copied[1][1][1][1] == 0.0
@@ -180,6 +180,7 @@ def test_nested_composition_run(benchmark, executions, mode):
 @pytest.mark.parametrize("executions", [1, 10, 100])
 @pytest.mark.parametrize("mode", ['Python',
                                   pytest.param('LLVM', marks=pytest.mark.llvm),
+                                  pytest.param('LLVMThreads', marks=pytest.mark.llvm),
                                   pytest.param('PTX', marks=[pytest.mark.llvm, pytest.mark.cuda])])
 def test_nested_composition_run_trials_inputs(benchmark, executions, mode):
     benchmark.group = "Nested Composition mutliple trials/inputs multirun {}".format(executions)
@@ -220,6 +221,10 @@ def test_nested_composition_run_trials_inputs(benchmark, executions, mode):
         e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)])
         res = e.run(var, 4, 2)
         benchmark(e.run, var, 4, 2)
+    elif mode == 'LLVMThreads':
+        e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)])
+        res = e.thread_run(var, 4, 2, jobs=3)
+        benchmark(e.thread_run, var, 4, 2, jobs=3)
     elif mode == 'PTX':
         e = pnlvm.execution.CompExecution(outer_comp, [None for _ in range(executions)])
         res = e.cuda_run(var, 4, 2)
@@ -990,6 +990,68 @@ class TestLog:
         t.log.nparray()
         t.log.nparray_dictionary()
 
+    @pytest.mark.composition
+    @pytest.mark.parametrize('mode', [pnl.ExecutionMode.Python,
+                                      pytest.param(pnl.ExecutionMode.LLVMExec, marks=pytest.mark.llvm),
+                                      pytest.param(pnl.ExecutionMode.LLVMRun, marks=pytest.mark.llvm)])
+    def test_log_compiled_execution(self, mode):
+        A = pnl.ProcessingMechanism(name='A')
+        B = pnl.TransferMechanism(name='B', integrator_mode=True, integration_rate=0.5)
+        comp = pnl.Composition(name='comp', pathways=[A, B])
+
+        B.set_log_conditions(pnl.VALUE)
+
+        comp.run(inputs={A: [[1.0], [2.0], [3.0]]}, execution_mode=mode)
+        comp.run(inputs={A: [[1.0]]}, execution_mode=mode)
+
+        log_dict = B.log.nparray_dictionary()[comp.default_execution_id]
+        assert log_dict['Run'] == [[0], [0], [0], [1]]
+        assert log_dict['Pass'] == [[0], [0], [0], [0]]
+        assert log_dict['Time_step'] == [[1], [1], [1], [1]]
+        assert np.allclose(log_dict['value'], [[[0.5]], [[1.25]], [[2.125]], [[1.5625]]])
+        assert A.log.logged_entries == {}
+
+    def test_log_entries_with_mixed_values(self):
+        t = pnl.TransferMechanism()
+        t.set_log_conditions(pnl.VALUE)
+
+        values = [np.array([[1.0]]), np.array([[2.0]]), 'three', None]
+        for v in values:
+            t.parameters.value.set(v, context='c', override=True)
+
+        logged = t.log.logged_entries['value']['c']
+        assert len(logged) == len(values)
+        assert isinstance(logged[0].value, np.ndarray)
+        assert np.array_equal(logged[1].value, values[1])
+        assert [entry.value for entry in logged[2:]] == values[2:]
+        assert all(entry.time == (None, None, None, None) for entry in logged)
+
+    def test_log_array_with_sparse_entries(self):
+        A = pnl.ProcessingMechanism(name='A')
+        B = pnl.ProcessingMechanism(name='B', function=pnl.Linear(slope=2.0))
+        comp = pnl.Composition(name='comp', pathways=[A, B])
+        comp.scheduler.add_condition(B, pnl.EveryNCalls(A, 2))
+
+        A.set_log_conditions(pnl.VALUE)
+        B.set_log_conditions(pnl.VALUE)
+
+        comp.run(
+            inputs={A: [[1.0], [2.0]]},
+            termination_processing={pnl.TimeScale.TRIAL: pnl.AfterNCalls(B, 1)}
+        )
+
+        data_array = comp.log.nparray(entries=['A', 'B'])[1][1]
+        assert data_array[0] == [['Run'], [0], [0], [0], [0], [0], [0]]
+        assert data_array[1] == [['Trial'], [0], [0], [0], [1], [1], [1]]
+        assert data_array[2] == [['Pass'], [0], [1], [1], [0], [1], [1]]
+        assert data_array[3] == [['Time_step'], [0], [0], [1], [0], [0], [1]]
+        assert data_array[4] == ['A', [[1.0]], [[1.0]], None, [[2.0]], [[2.0]], None]
+        assert data_array[5] == ['B', None, None, [[2.0]], None, None, [[4.0]]]
+
+        data_dict = comp.log.nparray_dictionary(entries=['A', 'B'])['comp']
+        assert data_dict['B'].dtype == object
+        assert [None if v is None else v.tolist() for v in data_dict['B']] == [None, None, [[2.0]], None, None, [[4.0]]]
+
 
 class TestClearLog:
 
@@ -655,3 +655,84 @@ class TestFullModels:
             expected_log_val[1][0][4],
             log_val
         )
+
+
+class TestDeliveryPipeline:
+
+    def test_delivery_pipeline(self):
+        T_1 = pnl.TransferMechanism(name='log_test_T_1', size=2)
+        T_2 = pnl.TransferMechanism(name='log_test_T_2', size=2)
+        PS = pnl.Composition(name='log_test_PS', pathways=[T_1, T_2])
+        pipeline = pnl.DeliveryPipeline(maxsize=1)
+        con_with_rpc_pipeline = pnl.Context(rpc_pipeline=pipeline, execution_id=PS)
+
+        T_1.set_delivery_conditions(pnl.RESULT)
+        T_2.set_delivery_conditions(pnl.VALUE)
+
+        PS.run(inputs={T_1: [[0, 0], [1, 2], [3, 4]]}, context=con_with_rpc_pipeline)
+        pipeline.close()
+
+        actual = list(pipeline)
+        assert [(i.componentName, i.parameterName, i.time) for i in actual] == [
+            ('log_test_T_1', 'RESULT', '0:0:0:0'),
+            ('log_test_T_2', 'value', '0:0:0:1'),
+            ('log_test_T_1', 'RESULT', '0:1:0:0'),
+            ('log_test_T_2', 'value', '0:1:0:1'),
+            ('log_test_T_1', 'RESULT', '0:2:0:0'),
+            ('log_test_T_2', 'value', '0:2:0:1'),
+        ]
+        assert [i.value.data for i in actual[::2]] == [[0.0, 0.0], [1.0, 2.0], [3.0, 4.0]]
+        assert actual[1].value.shape == [1, 2]
+        assert pipeline.dropped == 0
+
+    def test_delivery_pipeline_drop(self):
+        T = pnl.TransferMechanism(name='log_test_T')
+        comp = pnl.Composition(name='comp', nodes=[T])
+        pipeline = pnl.DeliveryPipeline(maxsize=1, overflow=pnl.DROP)
+
+        # hold the serializer so that batches accumulate in the queue
+        with pipeline._batch_lock:
+            pipeline._batches.put([])
+        T.set_delivery_conditions(pnl.VALUE)
+        comp.run([[1], [2], [3], [4]], context=pnl.Context(rpc_pipeline=pipeline, execution_id=comp))
+        pipeline.close()
+
+        delivered = len(list(pipeline))
+        assert delivered >= 1
+        assert delivered + pipeline.dropped == 4
+
+    def test_delivery_pipeline_overflow_error(self):
+        with pytest.raises(pnl.DeliveryError):
+            pnl.DeliveryPipeline(overflow='wait')
+
+    def test_serve_run_composition(self):
+        grpc = pytest.importorskip('grpc')
+        from concurrent import futures
+
+        T_1 = pnl.TransferMechanism(name='serve_T_1', size=2)
+        T_2 = pnl.TransferMechanism(name='serve_T_2', size=2)
+        comp = pnl.Composition(name='serve_comp', pathways=[T_1, T_2])
+
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+        pnl.add_ServeGraphServicer_to_server(pnl.CompositionServicer(comp), server)
+        port = server.add_insecure_port('localhost:0')
+        server.start()
+        try:
+            with grpc.insecure_channel(f'localhost:{port}') as channel:
+                stub = pnl.core.rpc.graph_pb2_grpc.ServeGraphStub(channel)
+                request = pnl.core.rpc.graph_pb2.RunTimeParams(
+                    inputs={'serve_T_1': pnl.core.rpc.graph_pb2.Matrix(rows=2, cols=2, data=[1, 2, 3, 4])},
+                    servePrefs=pnl.core.rpc.graph_pb2.ServePrefs(servePrefSet=[
+                        pnl.core.rpc.graph_pb2.ServePref(
+                            componentName='serve_T_2',
+                            parameterName='value',
+                            condition=pnl.core.rpc.graph_pb2.serveCondition.Value('EXECUTION')
+                        )
+                    ])
+                )
+                actual = list(stub.RunComposition(request))
+        finally:
+            server.stop(None)
+
+        assert [i.time for i in actual] == ['0:0:0:1', '0:1:0:1']
+        assert [i.value.data for i in actual] == [[1.0, 2.0], [3.0, 4.0]]
@@ -1,3 +1,4 @@
+import collections
 import copy
 import numpy as np
 import psyneulink as pnl
@@ -180,6 +181,57 @@ def test_get_previous(index, range_start, range_end, expected):
     assert previous == expected
 
 
+@pytest.mark.parametrize(
+    'index, range_start, range_end, expected',
+    [
+        (1, None, None, [[4]]),
+        (6, None, None, None),
+        (None, 2, None, [[[3]], [[4]]]),
+        (None, 2, 0, [[[3]], [[4]]]),
+        (None, 5, 2, [[[0]], [[1]], [[2]]]),
+        (None, 10, 2, [[[0]], [[1]], [[2]]])
+    ]
+)
+def test_get_previous_history_as_array(index, range_start, range_end, expected):
+    t = pnl.TransferMechanism()
+    t.parameters.value.history_as_array = True
+    t.parameters.value.history_max_length = 10
+
+    for i in range(1, 6):
+        t.execute(i)
+
+    previous = t.parameters.value.get_previous(
+        index=index,
+        range_start=range_start,
+        range_end=range_end,
+    )
+
+    if expected is None:
+        assert previous is None
+    else:
+        np.testing.assert_array_equal(previous, expected)
+    assert t.parameters.value.get_delta() == 1
+
+
+def test_history_as_array_shape_change():
+    t = pnl.TransferMechanism(default_variable=[0, 0])
+    t.parameters.value.history_as_array = True
+    t.parameters.value.history_max_length = 3
+
+    for i in range(1, 6):
+        t.execute([i, -i])
+    np.testing.assert_array_equal(t.parameters.value.get_previous(range_start=3), [[[2, -2]], [[3, -3]], [[4, -4]]])
+
+    t.parameters.value.history_max_length = 2
+    np.testing.assert_array_equal(t.parameters.value.get_previous(range_start=3), [[[3, -3]], [[4, -4]]])
+
+    # values that don't match the shape of those in the history revert it to a deque
+    t.parameters.value.set(np.array([1.0]), override=True)
+    t.parameters.value.set(np.array([2.0]), override=True)
+    assert isinstance(t.parameters.value.history[None], collections.deque)
+    np.testing.assert_array_equal(t.parameters.value.get_previous(), [1.0])
+
+
 def test_delta():
     t = pnl.TransferMechanism()
 
@@ -258,6 +310,36 @@ def test_copy():
     assert g.parameters.additive_param.source is g.parameters.intercept
 
 
+@pytest.mark.parametrize('copy_on_access', [False, True])
+def test_initialize_from_context(copy_on_access):
+    t = pnl.TransferMechanism(default_variable=np.zeros(1000))
+    c = pnl.Composition(pathways=[t])
+    c.run({t: [np.ones(1000), np.full(1000, 2.0)]}, context='base')
+
+    base = pnl.Context(execution_id='base')
+    sim = pnl.Context(execution_id='sim')
+    c._initialize_from_context(sim, base, copy_on_access=copy_on_access)
+    base_value = t.parameters.value._get(base)
+    base_usage = c._get_context_memory_usage(base)
+
+    if copy_on_access:
+        assert c._get_context_memory_usage(sim) < base_usage / 100
+    else:
+        assert c._get_context_memory_usage(sim) >= base_usage
+
+    sim_value = t.parameters.value._get(sim)
+    np.testing.assert_array_equal(sim_value, base_value)
+    assert sim_value is not base_value
+
+    sim_value[0][0] = -1
+    assert base_value[0][0] == 2.0
+
+    c.run({t: [np.full(1000, 3.0)]}, context='sim')
+    np.testing.assert_array_equal(t.parameters.value.get_previous(sim), sim_value)
+    np.testing.assert_array_equal(t.parameters.value._get(sim), np.full((1, 1000), 3.0))
+    np.testing.assert_array_equal(t.parameters.value._get(base), np.full((1, 1000), 2.0))
+    np.testing.assert_array_equal(t.parameters.value.get_previous(base), np.ones((1, 1000)))
+
 @pytest.mark.parametrize(
     'cls_, kwargs, parameter, is_user_specified',
     [